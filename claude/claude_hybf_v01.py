@@ -7,7 +7,11 @@ Created on Sun Jan 12 15:56:51 2025
 
 from dotenv import load_dotenv
 from anthropic import Anthropic
+import functools
+import os
+import time
 #from claude_logger import ClaudeLogger
+from token_count import local_count_tokens
 #load environment variable
 load_dotenv('.env')
 
@@ -18,10 +22,15 @@ client = Anthropic()
 model = "claude-3-5-sonnet-latest"
 
 
-def read_file(path):
+# Keyed on mtime so an edited prompt file is picked up while unchanged ones stay in memory.
+@functools.lru_cache(maxsize=32)
+def _read_cached(path, mtime):
     with open(path, 'r') as fh:
         return fh.read()
 
+def read_file(path):
+    return _read_cached(path, os.path.getmtime(path))
+
 def save_file(path, text):
     with open(path, 'w') as fh:
         return fh.write(text)
@@ -34,11 +43,11 @@ system=[
       {
         "type": "text",
         "text": system_prompt,
+        "cache_control": {"type": "ephemeral"}
       },
       {
         "type": "text",
         "text": memory_json
-        #"cache_control": {"type": "ephemeral"}
       }
     ]
 
@@ -50,12 +59,22 @@ messages=[{
     }]
 }]
 
-token_count = client.messages.count_tokens(
-    model=model,system=system,
-    messages=messages
-)
+if os.environ.get("HYBF_EXACT_TOKENS"):
+    input_tokens = client.messages.count_tokens(
+        model=model,system=system,
+        messages=messages
+    ).input_tokens
+    cache_threshold = 1024
+else:
+    input_tokens = local_count_tokens(system, messages)
+    # Leave a 10% margin since the local count is only an estimate.
+    cache_threshold = 1024 * 1.1
 
-print("Input Tokens:", token_count)
+print("Input Tokens:", input_tokens)
+
+# Prefixes below 1024 tokens are never cached, so don't waste a breakpoint on them.
+if input_tokens >= cache_threshold:
+    system[-1]["cache_control"] = {"type": "ephemeral"}
 
 if False:
     max_tokens = 8192
@@ -64,15 +83,27 @@ if False:
     #     messages=messages, 
     #     model=model, 
     #     system=system)
-    response = ""
-
-    with client.messages.stream(
-        max_tokens=max_tokens, 
-        messages=messages, 
-        model=model, 
-        system=system
-    ) as stream:
-      for text in stream.text_stream:
-          response += text
-          print(text, end="", flush=True)
-    save_file('response_2025.0112.1835.txt',response)
\ No newline at end of file
+
+    # Write chunks straight to disk instead of accumulating the response in memory.
+    with open('response_2025.0112.1835.txt', 'w') as fh:
+        t_first = None
+        t0 = time.perf_counter()
+        with client.messages.stream(
+            max_tokens=max_tokens, 
+            messages=messages, 
+            model=model, 
+            system=system
+        ) as stream:
+          for text in stream.text_stream:
+              fh.write(text)
+              if t_first is None:
+                  t_first = time.perf_counter()
+                  fh.flush()
+              print(text, end="", flush=True)
+          usage = stream.get_final_message().usage
+        t_end = time.perf_counter()
+    print("\nCache Creation Tokens:", usage.cache_creation_input_tokens)
+    print("Cache Read Tokens:", usage.cache_read_input_tokens)
+    if t_first is not None:
+        print(f"Time to first token: {t_first - t0:.3f}s")
+        print(f"Stream body: {t_end - t_first:.3f}s")
\ No newline at end of file
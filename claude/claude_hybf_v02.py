@@ -7,17 +7,25 @@ Created on Sun Jan 12 15:56:51 2025
 
 from dotenv import load_dotenv
 from anthropic import Anthropic
+import functools
+import os
 from datetime import datetime
+from token_count import local_count_tokens
 #load environment variable
 load_dotenv('.env')
 
 client = Anthropic()
 #claude = ClaudeLogger(client)
 
-def read_file(path):
+# Keyed on mtime so an edited prompt file is picked up while unchanged ones stay in memory.
+@functools.lru_cache(maxsize=32)
+def _read_cached(path, mtime):
     with open(path, 'r') as fh:
         return fh.read()
 
+def read_file(path):
+    return _read_cached(path, os.path.getmtime(path))
+
 def save_file(path, text):
     with open(path, 'w') as fh:
         return fh.write(text)
@@ -48,6 +56,7 @@ system=[
       {
         "type": "text",
         "text": system_prompt,
+        "cache_control": {"type": "ephemeral"}
       }
     ]
 
@@ -66,12 +75,24 @@ messages=[
     }]}
 ]
 
-token_count = client.messages.count_tokens(
-    model=model,system=system,
-    messages=messages[:]
-)
+if os.environ.get("HYBF_EXACT_TOKENS"):
+    input_tokens = client.messages.count_tokens(
+        model=model,system=system,
+        messages=messages[:]
+    ).input_tokens
+    cache_threshold = 1024
+else:
+    input_tokens = local_count_tokens(system, messages)
+    # Leave a 10% margin since the local count is only an estimate.
+    cache_threshold = 1024 * 1.1
+
+print("Input Tokens:", input_tokens)
 
-print("Input Tokens:", token_count)
+# Prefixes below 1024 tokens are never cached, so don't waste a breakpoint on them.
+# The replayed conversation, a one-line user turn and the long assistant reply
+# read from file, is the same on every run, so cache through its last block.
+if input_tokens >= cache_threshold:
+    messages[-1]["content"][-1]["cache_control"] = {"type": "ephemeral"}
 
 if False:
     max_tokens = 8192
@@ -86,4 +107,7 @@ if False:
       for text in stream.text_stream:
           response += text
           print(text, end="", flush=True)
+      usage = stream.get_final_message().usage
+    print("\nCache Creation Tokens:", usage.cache_creation_input_tokens)
+    print("Cache Read Tokens:", usage.cache_read_input_tokens)
     save_response(response)
\ No newline at end of file
@@ -1,12 +1,14 @@
 from typing import List, Union, Iterable, Literal
 
 import anthropic
+import atexit
 from anthropic import Anthropic
 from datetime import datetime
 import json
 import os
 from pathlib import Path
 import re
+import warnings
 
 from anthropic._utils._utils import required_args
 from anthropic._streaming import Stream, AsyncStream
@@ -16,59 +18,132 @@ from anthropic.types import TextBlockParam, ToolChoiceParam, ToolParam
 from anthropic.types import Message, RawMessageStreamEvent
 from anthropic import NOT_GIVEN, NotGiven
 
+# Code blocks with language specification
+_CODE_RE = re.compile(r"```(\w+)\n(.*?)```", re.DOTALL)
+
 class Convo:
     pass
 
 
 class ClaudeLogger:
-    def __init__(self, client: Anthropic, log_dir: str = "claude_logs"):
+    # Multipliers applied to the base input rate for each input token class.
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.1
+    
+    def __init__(
+        self,
+        client: Anthropic,
+        log_dir: str = "claude_logs",
+        input_cost_per_mtok: float = 3.0,
+        output_cost_per_mtok: float = 15.0
+    ):
         """
         Initialize the Claude Logger
         
         Args:
             client: Anthropic client instance
             log_dir: Directory to store log files (default: "claude_logs")
+            input_cost_per_mtok: Base price in USD per million input tokens
+            output_cost_per_mtok: Price in USD per million output tokens
         """
         self.client = client
+        self.input_cost_per_mtok = input_cost_per_mtok
+        self.output_cost_per_mtok = output_cost_per_mtok
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         self.convos = []
         
+        # Keep one buffered handle open for the logger's lifetime instead of
+        # reopening the daily file on every interaction.
+        self._fh = None
+        self._log_date = None
+        self._open_log_file()
+        atexit.register(self.close)
+        
     def _get_current_log_file(self) -> Path:
         """Get the path for today's log file."""
         current_date = datetime.now().strftime("%Y-%m-%d")
         return self.log_dir / f"{current_date}.md"
     
-    def _format_messages(self, messages) -> str:
-        """Format messages into a readable markdown structure."""
-        formatted = ""
+    def _open_log_file(self) -> None:
+        """Open today's log file, closing the previous day's handle if there is one."""
+        self.close()
+        log_file = self._get_current_log_file()
+        is_new = not log_file.exists()
+        self._log_date = datetime.now().date()
+        self._fh = open(log_file, "a", buffering=64 * 1024, encoding="utf-8")
+        if is_new:
+            self._fh.write(f"# {self._log_date.strftime('%Y-%m-%d')}\n")
+    
+    def close(self) -> None:
+        """Flush and close the log file."""
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
+    
+    def _write_messages(self, messages) -> None:
+        """Write messages to the log as a readable markdown structure."""
         for msg in messages:
             role = msg["role"].title()
             content = msg["content"]
             
             if isinstance(content, str):
-                formatted += f"#### {role}\n{content}\n\n"
+                self._fh.write(f"#### {role}\n{content}\n\n")
             else:
                 for item in content:
                     if item["type"] == "text":
-                        formatted += f"#### {role}\n{item['text']}\n\n"
+                        self._fh.write(f"#### {role}\n{item['text']}\n\n")
                     # Add handling for other content types (images, etc.) as needed
+    
+    def _uses_cache_control(self, *params) -> bool:
+        """Check whether any content block in the request carries a cache_control marker."""
+        for param in params:
+            if isinstance(param, dict):
+                if "cache_control" in param:
+                    return True
+                if self._uses_cache_control(*param.values()):
+                    return True
+            elif isinstance(param, (list, tuple)):
+                if self._uses_cache_control(*param):
+                    return True
+        return False
+    
+    def _summarize_usage(self, usage: dict) -> dict:
+        """
+        Collect the token counters from a response and derive the effective input and cost.
+        
+        usage.input_tokens excludes cache writes and reads, so all three classes
+        need to be summed to get the real prompt size.
+        """
+        input_tokens = usage.get('input_tokens') or 0
+        cache_creation = usage.get('cache_creation_input_tokens') or 0
+        cache_read = usage.get('cache_read_input_tokens') or 0
+        output_tokens = usage.get('output_tokens') or 0
+        
+        input_rate = self.input_cost_per_mtok / 1_000_000
+        output_rate = self.output_cost_per_mtok / 1_000_000
+        cost = (
+            input_tokens * input_rate
+            + cache_creation * input_rate * self.CACHE_WRITE_MULTIPLIER
+            + cache_read * input_rate * self.CACHE_READ_MULTIPLIER
+            + output_tokens * output_rate
+        )
         
-        return formatted
+        return {
+            'input_tokens': input_tokens,
+            'cache_creation_input_tokens': cache_creation,
+            'cache_read_input_tokens': cache_read,
+            'output_tokens': output_tokens,
+            'effective_input': input_tokens + cache_creation + cache_read,
+            'cost_usd': round(cost, 6),
+        }
     
     def _format_code_blocks(self, response: str) -> str:
         """Extract and format code blocks with proper syntax highlighting."""
-        # Find code blocks with language specification
-        code_pattern = r"```(\w+)\n(.*?)```"
-        formatted = response
-        
-        for match in re.finditer(code_pattern, response, re.DOTALL):
-            lang, code = match.groups()
-            # Ensure proper spacing and formatting
-            formatted_block = f"```{lang}\n{code.strip()}\n```\n"
-            formatted = formatted.replace(match.group(0), formatted_block)
-            
-        return formatted
+        # Rewrite every fenced block in a single pass, ensuring proper spacing
+        return _CODE_RE.sub(
+            lambda match: f"```{match.group(1)}\n{match.group(2).strip()}\n```\n",
+            response
+        )
     
     def log_interaction(self, **kwargs) -> None:
         """
@@ -79,7 +154,8 @@ class ClaudeLogger:
             response: Claude's response
             **kwargs: Additional parameters passed to the API (temperature, max_tokens, etc.)
         """
-        log_file = self._get_current_log_file()
+        if datetime.now().date() != self._log_date:
+            self._open_log_file()
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         request_data = kwargs
@@ -87,33 +163,36 @@ class ClaudeLogger:
         raw_response = request_data.pop('response').model_dump()
         response = raw_response['content'][0]['text']
         
+        usage = self._summarize_usage(raw_response.get('usage') or {})
+        cached = usage['cache_creation_input_tokens'] + usage['cache_read_input_tokens']
+        if cached > 0 and not self._uses_cache_control(request_data.get('system'), messages):
+            warnings.warn(
+                f"Response reports {cached} cached input tokens but the request set no cache_control."
+            )
         
-        
-        # Format the log entry
-        log_entry = f"""
+        # Write the log entry piecewise so large payloads are serialized
+        # straight into the file buffer rather than into intermediate strings
+        self._fh.write(f"""
 ## {timestamp}
 ### Prompt
 ```json
 #json.dumps(request_data, indent=2)
 ```
 
-{self._format_messages(messages)}
-### Response
-```json
-{json.dumps(response, indent=2)}
+""")
+        self._write_messages(messages)
+        self._fh.write("\n### Usage\n```json\n")
+        json.dump(usage, self._fh, indent=2)
+        self._fh.write("\n```\n\n### Response\n```json\n")
+        json.dump(response, self._fh, indent=2)
+        self._fh.write(f"""
 ```
 
 #### Agent
 {self._format_code_blocks(response)}
-"""
-        
-        # Create or append to the log file
-        mode = "a" if log_file.exists() else "w"
-        with open(log_file, "a", encoding="utf-8") as f:
-            if mode == "w":
-                f.write(f"# {datetime.now().strftime('%Y-%m-%d')}\n")
-            f.write(log_entry)
-            f.write("\n---\n")  # Add separator between entries
+
+---
+""")
     
     
     #def message_claude(self, messages, **kwargs) -> dict:
@@ -160,20 +239,26 @@ class ClaudeLogger:
         convo.top_k=top_k
         convo.top_p=top_p
         
-        response = self.client.messages.create(
-            max_tokens=max_tokens,
-            messages=messages,
-            model=model,
-            metadata=metadata,
-            stop_sequences=stop_sequences,
-            stream=stream,
-            system=system,
-            temperature=temperature,
-            tool_choice=tool_choice,
-            tools=tools,
-            top_k=top_k,
-            top_p=top_p
-        )
+        try:
+            response = self.client.messages.create(
+                max_tokens=max_tokens,
+                messages=messages,
+                model=model,
+                metadata=metadata,
+                stop_sequences=stop_sequences,
+                stream=stream,
+                system=system,
+                temperature=temperature,
+                tool_choice=tool_choice,
+                tools=tools,
+                top_k=top_k,
+                top_p=top_p
+            )
+        except Exception:
+            # Make sure earlier interactions reach disk before the error propagates
+            self._fh.flush()
+            raise
+        
         convo.response = response
         
         self.log_interaction(
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Local stand-in for the count_tokens endpoint, shared by the claude_hybf scripts.
+
+cl100k_base only approximates Claude's tokenizer, but it is close enough for a
+diagnostic print. tiktoken is optional: without it the count falls back to
+about four characters per token.
+"""
+
+MESSAGE_OVERHEAD_TOKENS = 4
+CHARS_PER_TOKEN = 4
+
+# The tiktoken encoding once loaded, False if tiktoken isn't installed
+_ENC = None
+
+def _encoding():
+    global _ENC
+    if _ENC is None:
+        try:
+            import tiktoken
+        except ImportError:
+            _ENC = False
+        else:
+            _ENC = tiktoken.get_encoding("cl100k_base")
+    return _ENC
+
+def _text_tokens(text):
+    enc = _encoding()
+    if enc:
+        return len(enc.encode(text))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def local_count_tokens(system, messages):
+    blocks = list(system)
+    for message in messages:
+        blocks.extend(message["content"])
+    text_tokens = sum(_text_tokens(block["text"]) for block in blocks)
+    return text_tokens + MESSAGE_OVERHEAD_TOKENS * len(messages)
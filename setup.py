@@ -34,6 +34,9 @@ setup(
         "pandas>=1.3.0",
     ],
     extras_require={
+        "jit": [
+            "numba>=0.57",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
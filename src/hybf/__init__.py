@@ -1,16 +1,59 @@
 # src/hybf/__init__.py
-from .formats.hybf import HYBFWriter, HYBFReader
+from importlib import import_module
+
+# Public name -> defining module. Modules are imported on first access, so
+# `import hybf` doesn't load pandas and every format implementation up front.
+_EXPORTS = {
+    'BaseWriter': 'hybf.core.base',
+    'BaseReader': 'hybf.core.base',
+    'BinaryReader': 'hybf.core.base',
+    'DataType': 'hybf.core.dtypes',
+    'ColumnInfo': 'hybf.core.dtypes',
+    'FormatType': 'hybf.core.dtypes',
+    'CompressionType': 'hybf.core.dtypes',
+    'HYBFWriter': 'hybf.formats.hybf',
+    'HYBFReader': 'hybf.formats.hybf',
+    'MinimalWriter': 'hybf.formats.minimal',
+    'MinimalReader': 'hybf.formats.minimal',
+    'CompressedWriter': 'hybf.formats.compressed',
+    'CompressedReader': 'hybf.formats.compressed',
+    'CompressionSelector': 'hybf.formats.compressed',
+    'FormatFactory': 'hybf.factory',
+}
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    try:
+        value = getattr(import_module(module), name)
+    except ImportError as exc:
+        # Report a name whose module can't load as missing, so getattr()
+        # defaults and hasattr() behave as for any other absent attribute
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({exc})") from exc
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
 def write_dataframe(df, path):
     """Write DataFrame to HYBF file."""
+    from .formats.hybf import HYBFWriter
     with open(path, 'wb') as f:
         writer = HYBFWriter()
         writer.write(df, f)
 
 def read_dataframe(path):
     """Read DataFrame from HYBF file."""
+    from .formats.hybf import HYBFReader
     with open(path, 'rb') as f:
         reader = HYBFReader()
         return reader.read(f)
 
-__all__ = ['write_dataframe', 'read_dataframe', 'HYBFWriter', 'HYBFReader']
\ No newline at end of file
+# formats.minimal, and the factory that uses it, import type classes that
+# core.types doesn't define, so their names stay out of `from hybf import *`
+_UNIMPORTABLE = {'MinimalWriter', 'MinimalReader', 'FormatFactory'}
+
+__all__ = ['write_dataframe', 'read_dataframe', *(name for name in _EXPORTS if name not in _UNIMPORTABLE)]
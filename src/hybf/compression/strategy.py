@@ -1,9 +1,58 @@
 # src/hybf/compression/strategy.py
 from abc import ABC, abstractmethod
-from typing import Type
+from dataclasses import dataclass
+from typing import Optional, Type
 import numpy as np
 from ..core.columns import Column, RawColumn
 from ..core.types import ColumnType
+from ..utils.jit import NUMBA_AVAILABLE, njit, prange
+
+# Dtypes whose codes are looked up against the sorted uniques instead of
+# taking np.unique's inverse (an argsort, slower than a plain sort)
+_NUMERIC_DTYPES = (np.dtype('int32'), np.dtype('int64'), np.dtype('float32'), np.dtype('float64'))
+
+@njit(parallel=True, cache=True)
+def _encode_sorted(data, uniques):
+    """Binary search every element of data in the sorted uniques array."""
+    out = np.empty(data.shape[0], dtype=np.intp)
+    last = uniques.shape[0] - 1
+    for i in prange(data.shape[0]):
+        value = data[i]
+        if value != value:
+            # np.unique sorts NaN to the end
+            out[i] = last
+            continue
+        lo = 0
+        hi = uniques.shape[0]
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if uniques[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        out[i] = lo
+    return out
+
+@dataclass
+class ColumnStats:
+    """Column summary computed in one pass and shared by every strategy's cost model."""
+    __slots__ = ('data', 'uniques', 'inverse')
+    data: np.ndarray
+    uniques: np.ndarray
+    # Index of each element in uniques; left as None for numeric dtypes, whose
+    # codes are found by binary search instead
+    inverse: Optional[np.ndarray]
+
+    @property
+    def row_count(self) -> int:
+        return len(self.data)
+
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> 'ColumnStats':
+        if data.dtype in _NUMERIC_DTYPES:
+            return cls(data, np.unique(data), None)
+        uniques, inverse = np.unique(data, return_inverse=True)
+        return cls(data, uniques, inverse)
 
 class CompressionStrategy(ABC):
     """Base class for compression strategies."""
@@ -23,22 +72,77 @@ class CompressionStrategy(ABC):
         """Estimate compressed size without actually compressing."""
         pass
 
+    def predicted_size(self, stats: ColumnStats) -> Optional[int]:
+        """
+        Predict the compressed size from column statistics, or None if this
+        strategy can't compress the column. Strategies override this to avoid
+        scanning the data; the default asks can_compress and estimate_size.
+        """
+        if not self.can_compress(stats.data):
+            return None
+        return self.estimate_size(stats.data)
+
+# Dictionary encoding only pays when at most this share of the values is distinct
+MAX_UNIQUE_RATIO = 0.1
+
+def _code_dtype(unique_count: int) -> np.dtype:
+    """Smallest unsigned dtype able to index a dictionary of unique_count values."""
+    if unique_count <= 1 << 8:
+        return np.dtype(np.uint8)
+    if unique_count <= 1 << 16:
+        return np.dtype(np.uint16)
+    return np.dtype(np.uint32)
+
 class DictionaryStrategy(CompressionStrategy):
     """Dictionary encoding for low-cardinality data."""
     
+    def __init__(self):
+        # predicted_size (or can_compress and estimate_size) and compress are
+        # called back to back on the same array, so keep the last stats around
+        self._cache = None
+
+    def _stats(self, data: np.ndarray) -> ColumnStats:
+        """Return the stats of data, reusing the cached result."""
+        if self._cache is None or self._cache.data is not data:
+            self._cache = ColumnStats.from_array(data)
+        return self._cache
+
+    def _encode(self, data: np.ndarray) -> np.ndarray:
+        """Return the dictionary code of every element of data."""
+        stats = self._stats(data)
+        inverse = stats.inverse
+        if inverse is None:
+            if NUMBA_AVAILABLE:
+                inverse = _encode_sorted(data, stats.uniques)
+            else:
+                inverse = np.searchsorted(stats.uniques, data)
+        return inverse
+
     def can_compress(self, data: np.ndarray) -> bool:
         if not data.size:
             return False
-        unique_count = len(np.unique(data))
-        return unique_count <= len(data) * 0.1  # 10% threshold
+        return self.predicted_size(self._stats(data)) is not None
 
     def compress(self, data: np.ndarray, type_info: ColumnType) -> Column:
-        # Basic dictionary encoding implementation
-        unique_values = np.unique(data)
-        value_to_id = {val: idx for idx, val in enumerate(unique_values)}
-        encoded = np.array([value_to_id[val] for val in data], dtype=np.uint32)
-        return RawColumn(type_info, encoded)
+        unique_values = self._stats(data).uniques
+        inverse = self._encode(data)
+        self._cache = None
+        # RawColumn's header records the narrowed dtype string, so the reader
+        # gets the codes back at this width
+        codes = inverse.astype(_code_dtype(len(unique_values)), copy=False)
+        return RawColumn(type_info, codes)
 
     def estimate_size(self, data: np.ndarray) -> int:
-        unique_count = len(np.unique(data))
-        return unique_count * 8 + len(data)  # Rough estimate
\ No newline at end of file
+        return self._size(self._stats(data))
+
+    def predicted_size(self, stats: ColumnStats) -> Optional[int]:
+        # Keep the stats so compress doesn't recompute the uniques
+        self._cache = stats
+        if not stats.row_count or len(stats.uniques) > stats.row_count * MAX_UNIQUE_RATIO:
+            return None
+        return self._size(stats)
+
+    @staticmethod
+    def _size(stats: ColumnStats) -> int:
+        code_size = _code_dtype(len(stats.uniques)).itemsize
+        return len(stats.uniques) * 8 + stats.row_count * code_size  # Rough estimate
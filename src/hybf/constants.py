@@ -3,4 +3,7 @@ Package-wide constants for the hybf format.
 """
 
 MAGIC_NUMBER = b'HYBF'
-VERSION = 1
+# Version 2 changed how HYBF files store raw columns; the minimal and
+# compressed layouts are unchanged, so their readers accept either version
+VERSION = 2
+MIN_VERSION = 1
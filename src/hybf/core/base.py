@@ -3,15 +3,35 @@ Abstract classes for readers/writers.
 Adds the MAGIC_NUMBER and VERSION to the beginning of the file.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 import struct
-import pandas as pd
 import numpy as np
 import io
-from typing import List, BinaryIO
+import mmap
+import os
+import weakref
+from typing import List, BinaryIO, TYPE_CHECKING
+
+from ..constants import MAGIC_NUMBER, VERSION, MIN_VERSION
+from .dtypes import ColumnInfo, FormatType, DATA_TYPE_BY_VALUE, FORMAT_TYPE_BY_VALUE
+
+if TYPE_CHECKING:
+    # Only referenced in annotations; the format modules import pandas themselves
+    import pandas as pd
+
+# Reads at least this large from real files are memory-mapped instead of copied
+MMAP_THRESHOLD = 1 << 20
 
-from ..constants import MAGIC_NUMBER, VERSION
-from .dtypes import DataType, ColumnInfo, FormatType
+# Read-only maps of whole files, shared by every reader of the same file object
+# so each large column is a view into one mapping rather than a mapping of its own
+_FILE_MAPS = weakref.WeakKeyDictionary()
+
+# magic, version, format type, big-endian uint16 column count
+_HEADER = struct.Struct('>4sBBH')
+# dtype value and name length ahead of each column name
+_COLUMN_PREFIX = struct.Struct('BB')
 
 class BaseWriter(ABC):
     """Abstract base class for format writers."""
@@ -23,21 +43,24 @@ class BaseWriter(ABC):
     
     def write_header(self, file: BinaryIO, format_type: FormatType, num_columns: int) -> None:
         """Write the common file header."""
-        file.write(MAGIC_NUMBER)
-        file.write(struct.pack('BB', VERSION, format_type.value))
-        file.write(struct.pack('>H', num_columns))  # big-endian uint16
+        file.write(_HEADER.pack(MAGIC_NUMBER, VERSION, format_type.value, num_columns))
         
     def write_column_definitions(self, file: BinaryIO, columns: List[ColumnInfo]) -> None:
         """Write column metadata."""
+        # Pack every definition up front and hand the file a single write
+        parts = []
         for col in columns:
-            file.write(struct.pack('B', col.dtype.value))
             name_bytes = col.name.encode('utf-8')
-            file.write(struct.pack('B', len(name_bytes)))
-            file.write(name_bytes)
+            parts.append(_COLUMN_PREFIX.pack(col.dtype.value, len(name_bytes)))
+            parts.append(name_bytes)
+        file.write(b''.join(parts))
 
 class BaseReader(ABC):
     """Abstract base class for format readers."""
     
+    # Column definitions are fetched in reads of this size and parsed in memory
+    COLUMN_BLOCK_SIZE = 4096
+    
     @abstractmethod
     def read(self, file: BinaryIO) -> pd.DataFrame:
         """Read dataframe from file."""
@@ -45,34 +68,75 @@ class BaseReader(ABC):
     
     def read_header(self, file: BinaryIO) -> tuple[int, FormatType, int]:
         """Read and validate file header."""
-        magic = file.read(4)
-        if magic != MAGIC_NUMBER:
+        data = file.read(_HEADER.size)
+        if data[:4] != MAGIC_NUMBER or len(data) != _HEADER.size:
             raise ValueError("Invalid file format")
         
-        version, format_type = struct.unpack('BB', file.read(2))
-        if version != VERSION:
+        _, version, format_type, num_columns = _HEADER.unpack(data)
+        if not MIN_VERSION <= version <= VERSION:
             raise ValueError(f"Unsupported version: {version}")
             
-        num_columns = struct.unpack('>H', file.read(2))[0]
-        return version, FormatType(format_type), num_columns
+        try:
+            return version, FORMAT_TYPE_BY_VALUE[format_type], num_columns
+        except KeyError:
+            raise ValueError(f"{format_type} is not a valid FormatType") from None
     
     def read_column_definitions(self, file: BinaryIO, num_columns: int) -> List[ColumnInfo]:
-        """Read column metadata."""
+        """
+        Read column metadata.
+        
+        Definitions are parsed out of COLUMN_BLOCK_SIZE reads rather than three
+        small reads per column; the file is then seeked back over any bytes the
+        last block read past the final definition. Streams that can't seek,
+        such as pipes, are read one definition at a time instead.
+        """
+        seekable = file.seekable()
         columns = []
+        block = b''
+        off = 0
         for _ in range(num_columns):
-            dtype_value = struct.unpack('B', file.read(1))[0]
-            name_length = struct.unpack('B', file.read(1))[0]
-            name = file.read(name_length).decode('utf-8')
-            columns.append(ColumnInfo(name, DataType(dtype_value)))
+            # Refill when the next dtype/length pair or name isn't fully buffered
+            if off + 2 > len(block) or off + 2 + block[off + 1] > len(block):
+                block = block[off:]
+                off = 0
+                if seekable:
+                    block += file.read(self.COLUMN_BLOCK_SIZE)
+                else:
+                    # Read exactly the dtype/length pair, then the name
+                    block += file.read(2 - len(block))
+                    if len(block) == 2:
+                        block += file.read(block[1])
+                if len(block) < 2 or 2 + block[1] > len(block):
+                    raise EOFError("Insufficient data: truncated column definitions")
+            dtype_value = block[off]
+            name_length = block[off + 1]
+            name = block[off + 2:off + 2 + name_length].decode('utf-8')
+            off += 2 + name_length
+            try:
+                columns.append(ColumnInfo(name, DATA_TYPE_BY_VALUE[dtype_value]))
+            except KeyError:
+                raise ValueError(f"{dtype_value} is not a valid DataType") from None
+        if off < len(block):
+            file.seek(off - len(block), io.SEEK_CUR)
         return columns
 
-class BinaryReader:
-    """Helper class for reading binary data from both files and buffers."""
+class BinaryReader(ABC):
+    """
+    Helper class for reading binary data from both files and buffers.
+
+    Constructing a BinaryReader returns a _BufferReader for in-memory buffers
+    and a _FileReader for everything else, so read_array never has to check
+    the source type on each call.
+    """
     
+    def __new__(cls, source: BinaryIO):
+        if cls is BinaryReader:
+            cls = _BufferReader if isinstance(source, io.BytesIO) else _FileReader
+        return super().__new__(cls)
+
     def __init__(self, source: BinaryIO):
         """Initialize reader with a file-like object."""
         self.source = source
-        self._is_buffer = isinstance(source, io.BytesIO)
         
     def read_bytes(self, count: int) -> bytes:
         """
@@ -87,6 +151,7 @@ class BinaryReader:
         """
         return self.source.read(count)
 
+    @abstractmethod
     def read_array(self, dtype: np.dtype, count: int) -> np.ndarray:
         """
         Read a numpy array of specified dtype and count from the source.
@@ -98,29 +163,85 @@ class BinaryReader:
         Returns:
             numpy array of the requested type and size
         """
+        pass
+
+    def _read_copied(self, dtype: np.dtype, bytes_to_read: int) -> np.ndarray:
+        """Read exact number of bytes and wrap them with frombuffer."""
+        data = self.source.read(bytes_to_read)
+        if len(data) != bytes_to_read:
+            raise EOFError(f"Insufficient data: expected {bytes_to_read} bytes, got {len(data)}")
+        return np.frombuffer(data, dtype=dtype)
+
+class _BufferReader(BinaryReader):
+    """BinaryReader for io.BytesIO sources."""
+
+    def read_array(self, dtype: np.dtype, count: int) -> np.ndarray:
+        # readinto a bytearray leaves the array writable, so callers can
+        # adopt it without taking a copy of their own
+        bytes_to_read = dtype.itemsize * count
+        data = bytearray(bytes_to_read)
+        read = self.source.readinto(data)
+        if read != bytes_to_read:
+            raise EOFError(f"Insufficient data: expected {bytes_to_read} bytes, got {read}")
+        return np.frombuffer(data, dtype=dtype)
+
+class _FileReader(BinaryReader):
+    """BinaryReader for files and other non-BytesIO file-like objects."""
+
+    def __init__(self, source: BinaryIO):
+        super().__init__(source)
+        # Decide once whether the source has a real descriptor for fromfile/mmap;
+        # io.UnsupportedOperation is an OSError
+        try:
+            self._fileno = source.fileno()
+        except (AttributeError, OSError):
+            self._fileno = None
+        self._use_fromfile = self._fileno is not None
+
+    def read_array(self, dtype: np.dtype, count: int) -> np.ndarray:
         # Calculate bytes to read
         bytes_to_read = dtype.itemsize * count
+
+        if not self._use_fromfile:
+            # Non-standard file objects can only be read into memory
+            return self._read_copied(dtype, bytes_to_read)
+        if bytes_to_read >= MMAP_THRESHOLD:
+            return self._read_mapped(dtype, count, bytes_to_read)
+
+        # For files, use efficient fromfile
+        result = np.fromfile(self.source, dtype=dtype, count=count)
+        if len(result) != count:
+            raise EOFError(f"Insufficient data: expected {count} elements, got {len(result)}")
+        return result
+
+    def _read_mapped(self, dtype: np.dtype, count: int, bytes_to_read: int) -> np.ndarray:
+        """
+        Return a read-only array backed by a memory map of the file.
         
-        if self._is_buffer:
-            # For BytesIO, read exact number of bytes and use frombuffer
-            data = self.source.read(bytes_to_read)
-            if len(data) != bytes_to_read:
-                raise EOFError(f"Insufficient data: expected {bytes_to_read} bytes, got {len(data)}")
-            return np.frombuffer(data, dtype=dtype)
-        else:
-            # For files, use efficient fromfile
-            # Save current position in case we need to retry
-            pos = self.source.tell()
-            try:
-                result = np.fromfile(self.source, dtype=dtype, count=count)
-                if len(result) != count:
-                    raise EOFError(f"Insufficient data: expected {count} elements, got {len(result)}")
-                return result
-            except (AttributeError, TypeError):
-                # If fromfile fails (e.g., with non-standard file objects),
-                # fall back to read+frombuffer approach
-                self.source.seek(pos)
-                data = self.source.read(bytes_to_read)
-                if len(data) != bytes_to_read:
-                    raise EOFError(f"Insufficient data: expected {bytes_to_read} bytes, got {len(data)}")
-                return np.frombuffer(data, dtype=dtype)
\ No newline at end of file
+        The OS pages the data in on demand, so no copy is made into the heap.
+        The array holds a reference to the mapping, which keeps it open.
+        """
+        pos = self.source.tell()
+        mapped = self._file_map(pos, bytes_to_read)
+        self.source.seek(pos + bytes_to_read)
+        return np.frombuffer(mapped, dtype=dtype, count=count, offset=pos)
+
+    def _file_map(self, pos: int, bytes_to_read: int) -> mmap.mmap:
+        """Get the shared map of the source file, remapping if it no longer covers the read."""
+        end = pos + bytes_to_read
+        try:
+            mapped = _FILE_MAPS.get(self.source)
+        except TypeError:  # not weak-referenceable
+            mapped = None
+        if mapped is not None and len(mapped) >= end:
+            return mapped
+        
+        size = os.fstat(self._fileno).st_size
+        if size < end:
+            raise EOFError(f"Insufficient data: expected {bytes_to_read} bytes, got {size - pos}")
+        mapped = mmap.mmap(self._fileno, length=0, access=mmap.ACCESS_READ)
+        try:
+            _FILE_MAPS[self.source] = mapped
+        except TypeError:
+            pass
+        return mapped
@@ -1,7 +1,9 @@
 # src/hybf/core/columns.py
 from abc import ABC, abstractmethod
 from typing import BinaryIO, Optional
+import struct
 import numpy as np
+from .base import BinaryReader
 from .types import ColumnType
 
 class Column(ABC):
@@ -27,13 +29,49 @@ class Column(ABC):
         pass
 
 class RawColumn(Column):
-    """Direct storage with optional bit-width reduction."""
+    """Direct storage with optional bit-width reduction.
     
+    Layout: dtype string length (1 byte), numpy dtype string, element count
+    (uint32), then the raw array bytes. The dtype is stored explicitly because
+    compressed columns may be narrower than the column's logical type.
+    """
+    
+    def _header(self) -> bytes:
+        dtype_code = self._data.dtype.str.encode('ascii')
+        return struct.pack(f'>B{len(dtype_code)}sI', len(dtype_code), dtype_code, len(self._data))
+
     def write(self, buffer: BinaryIO) -> None:
         if self._data is None:
             raise ValueError("No data to write")
             
-        # Write data using numpy's built-in binary format
+        buffer.write(self._header())
+        if self._data.dtype.hasobject:
+            # Object arrays have no fixed-width layout, defer to numpy's format
+            np.save(buffer, self._data)
+        else:
+            # Write straight from the array's memory rather than a bytes copy
+            buffer.write(np.ascontiguousarray(self._data).view(np.uint8))
+
+    def read(self, buffer: BinaryIO, row_count: int) -> np.ndarray:
+        # The element count is taken from the column header
+        dtype_length = struct.unpack('B', buffer.read(1))[0]
+        dtype = np.dtype(buffer.read(dtype_length).decode('ascii'))
+        count = struct.unpack('>I', buffer.read(4))[0]
+        if dtype.hasobject:
+            return np.load(buffer)
+        return BinaryReader(buffer).read_array(dtype, count)
+
+    def get_size(self) -> int:
+        if self._data is None:
+            return 0
+        return self._data.nbytes + len(self._header())
+
+class NpyColumn(Column):
+    """Direct storage in numpy's .npy layout, as written by format version 1."""
+
+    def write(self, buffer: BinaryIO) -> None:
+        if self._data is None:
+            raise ValueError("No data to write")
         np.save(buffer, self._data)
 
     def read(self, buffer: BinaryIO, row_count: int) -> np.ndarray:
@@ -21,31 +21,33 @@ class DataType(Enum):
     @classmethod
     def from_numpy(cls, dtype: np.dtype) -> 'DataType':
         """Convert numpy dtype to our DataType enum."""
-        mapping = {
-            np.dtype('int32'): cls.INT32,
-            np.dtype('int64'): cls.INT64,
-            np.dtype('float32'): cls.FLOAT32,
-            np.dtype('float64'): cls.FLOAT64,
-            np.dtype('bool'): cls.BOOLEAN,
-            np.dtype('O'): cls.STRING,  # Object type usually means string in pandas
-        }
-        return mapping.get(dtype, cls.STRING)
+        return _FROM_NUMPY.get(dtype, cls.STRING)
 
     def to_numpy(self) -> np.dtype:
         """Convert DataType to numpy dtype."""
-        mapping = {
-            self.INT32: np.dtype('int32'),
-            self.INT64: np.dtype('int64'),
-            self.FLOAT32: np.dtype('float32'),
-            self.FLOAT64: np.dtype('float64'),
-            self.BOOLEAN: np.dtype('bool'),
-            self.STRING: np.dtype('O'),
-        }
-        return mapping[self]
+        return _TO_NUMPY[self]
+
+# Built once at import rather than on every conversion
+_FROM_NUMPY = {
+    np.dtype('int32'): DataType.INT32,
+    np.dtype('int64'): DataType.INT64,
+    np.dtype('float32'): DataType.FLOAT32,
+    np.dtype('float64'): DataType.FLOAT64,
+    np.dtype('bool'): DataType.BOOLEAN,
+    np.dtype('O'): DataType.STRING,  # Object type usually means string in pandas
+}
+_TO_NUMPY = {v: k for k, v in _FROM_NUMPY.items()}
+
+# Stored value -> member tables for decode loops; a dict hit is several times
+# cheaper than the Enum(value) call machinery. Unknown values raise KeyError.
+DATA_TYPE_BY_VALUE = {member.value: member for member in DataType}
 
 @dataclass
 class ColumnInfo:
     """Metadata for a column."""
+    # One instance per column. Slots leave out the per-instance __dict__, here
+    # and on the other per-column classes (StorageType, ColumnType, ColumnStats)
+    __slots__ = ('name', 'dtype')
     name: str
     dtype: DataType
 
@@ -55,6 +57,8 @@ class FormatType(Enum):
     MINIMAL = 1
     COMPRESSED = 2
 
+FORMAT_TYPE_BY_VALUE = {member.value: member for member in FormatType}
+
 
 class CompressionType(Enum):
     """Available compression strategies."""
@@ -63,3 +67,6 @@ class CompressionType(Enum):
     DICTIONARY = 3
     SINGLE_VALUE = 4
     NULL = 5
+    QUANTIZED = 6
+
+COMPRESSION_TYPE_BY_VALUE = {member.value: member for member in CompressionType}
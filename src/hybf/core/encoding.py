@@ -2,63 +2,96 @@
 Special Writer for BitPackedDictionaryWriter. Maybe needs to be in a new file like /hybf/src/hybf/formats/dictionary.py?
 """
 import math
-from typing import BinaryIO, Dict
+from typing import BinaryIO
 import struct
-import pandas as pd
 import numpy as np
 
+from ..utils.jit import NUMBA_AVAILABLE, njit
+
+# Dictionary size and bits per packed index
+_DICT_HEADER = struct.Struct('>HB')
+
+def _pack_codes(codes: np.ndarray, bits_needed: int) -> bytes:
+    """
+    Pack codes into a big-endian bitstream of bits_needed bits each.
+    
+    Byte-aligned widths are a plain big-endian cast, and widths dividing 8
+    are shifted together several codes per byte. Other widths spread every
+    code into its bits (most significant first) and np.packbits joins them,
+    zero-filling the final partial byte on the right.
+    """
+    if bits_needed % 8 == 0:
+        return codes.astype(f'>u{bits_needed // 8}').tobytes()
+    if 8 % bits_needed == 0:
+        per_byte = 8 // bits_needed
+        padded = np.zeros(-(-len(codes) // per_byte) * per_byte, dtype=np.uint8)
+        padded[:len(codes)] = codes
+        shifts = np.arange(8 - bits_needed, -1, -bits_needed, dtype=np.uint8)
+        return np.bitwise_or.reduce(padded.reshape(-1, per_byte) << shifts, axis=1).tobytes()
+    
+    shifts = np.arange(bits_needed - 1, -1, -1, dtype=np.uint32)
+    bits = ((codes[:, None] >> shifts) & 1).astype(np.uint8)
+    return np.packbits(bits).tobytes()
+
+@njit(cache=True)
+def _unpack_codes_jit(packed, count, bits_needed):
+    """Read count big-endian codes of bits_needed bits from a uint8 array."""
+    out = np.empty(count, dtype=np.uint32)
+    mask = (1 << bits_needed) - 1
+    acc = 0
+    nbits = 0
+    pos = 0
+    for i in range(count):
+        while nbits < bits_needed:
+            acc = (acc << 8) | packed[pos]
+            pos += 1
+            nbits += 8
+        nbits -= bits_needed
+        out[i] = (acc >> nbits) & mask
+        acc &= (1 << nbits) - 1
+    return out
+
+def _unpack_codes_numpy(packed: np.ndarray, count: int, bits_needed: int) -> np.ndarray:
+    """numpy fallback for _unpack_codes_jit: right-align each code's bits in 32 and repack."""
+    bits = np.unpackbits(packed, count=count * bits_needed).reshape(count, bits_needed)
+    padded = np.zeros((count, 32), dtype=np.uint8)
+    padded[:, 32 - bits_needed:] = bits
+    return np.packbits(padded, axis=1).view('>u4').ravel().astype(np.uint32)
+
+_unpack_codes = _unpack_codes_jit if NUMBA_AVAILABLE else _unpack_codes_numpy
+
 class BitPackedDictionaryWriter:
     """Writes dictionary-encoded data using minimum necessary bits per value."""
     
-    def write_dictionary(self, buffer: BinaryIO, series: pd.Series, value_dict: Dict) -> None:
+    def write_dictionary(self, buffer: BinaryIO, codes: np.ndarray, uniques: np.ndarray) -> None:
         """Write dictionary-encoded column using minimum bits per value.
         
         Args:
             buffer: Binary buffer to write to
-            series: Data to encode
-            value_dict: Dictionary mapping indexes to values
+            codes: Index into uniques for each row, -1 for nulls (as from pd.factorize)
+            uniques: Dictionary values
         """
-        dict_size = len(value_dict)
+        dict_size = len(uniques)
         bits_needed = max(1, math.ceil(math.log2(dict_size + 1)))  # +1 for null value
         
-        # Write dictionary metadata
-        buffer.write(struct.pack('>HB', dict_size, bits_needed))
-        reverse_dict = {v: k for k, v in value_dict.items()}
-        
-        # Write dictionary values
-        for value in value_dict.values():
+        # Write dictionary metadata and length-prefixed values in one go
+        parts = [_DICT_HEADER.pack(dict_size, bits_needed)]
+        for value in uniques:
             val_bytes = str(value).encode('utf-8')
-            buffer.write(struct.pack('B', len(val_bytes)))
-            buffer.write(val_bytes)
+            if len(val_bytes) > 255:
+                raise ValueError(f"Dictionary value is {len(val_bytes)} bytes; at most 255 fit the length prefix")
+            parts.append(bytes((len(val_bytes),)))
+            parts.append(val_bytes)
+        buffer.write(b''.join(parts))
         
-        # Pack values into bits
-        current_byte = 0
-        bits_in_byte = 0
-        null_value = (1 << bits_needed) - 1  # Use maximum value for null
-        
-        for value in series:
-            # Get the index (using max value for null)
-            if pd.isna(value):
-                index = null_value
-            else:
-                index = reverse_dict[value]
-                
-            # Add bits to current byte
-            current_byte = (current_byte << bits_needed) | index
-            bits_in_byte += bits_needed
-            
-            # Write complete bytes
-            while bits_in_byte >= 8:
-                out_byte = current_byte >> (bits_in_byte - 8)
-                buffer.write(bytes([out_byte & 0xFF]))
-                current_byte &= (1 << (bits_in_byte - 8)) - 1
-                bits_in_byte -= 8
+        # The codes are already the indexes; nulls take the max value. A single
+        # unsigned cast wraps the -1 null codes to the top of the range, and
+        # clamping in place brings them down to null_value without a copy
+        null_value = (1 << bits_needed) - 1
+        codes = codes.astype(np.uint32)
+        np.minimum(codes, null_value, out=codes)
         
-        # Write final partial byte if any
-        if bits_in_byte > 0:
-            # Left-align remaining bits in final byte
-            current_byte = current_byte << (8 - bits_in_byte)
-            buffer.write(bytes([current_byte & 0xFF]))
+        buffer.write(_pack_codes(codes, bits_needed))
 
 class BitPackedDictionaryReader:
     """Reads dictionary-encoded data that uses minimum bits per value."""
@@ -74,14 +107,14 @@ class BitPackedDictionaryReader:
             numpy array containing decoded values
         """
         # Read dictionary metadata
-        dict_size, bits_needed = struct.unpack('>HB', buffer.read(3))
+        dict_size, bits_needed = _DICT_HEADER.unpack(buffer.read(_DICT_HEADER.size))
         
-        # Read dictionary values
-        value_dict = {}
+        # Read dictionary values straight into the lookup table; the extra
+        # final slot stays None and stands in for the null index
+        lookup = np.empty(dict_size + 1, dtype='O')
         for i in range(dict_size):
-            length = struct.unpack('B', buffer.read(1))[0]
-            value = buffer.read(length).decode('utf-8')
-            value_dict[i] = value
+            length = buffer.read(1)[0]
+            lookup[i] = buffer.read(length).decode('utf-8')
         
         # Calculate total bytes needed
         total_bits = row_count * bits_needed
@@ -89,39 +122,10 @@ class BitPackedDictionaryReader:
         
         # Read all packed bytes
         packed_data = buffer.read(total_bytes)
+        if len(packed_data) != total_bytes:
+            raise EOFError(f"Insufficient data: expected {total_bytes} bytes, got {len(packed_data)}")
         
-        # Unpack values
-        values = []
-        current_byte = 0
-        bits_in_byte = 0
-        null_value = (1 << bits_needed) - 1
-        mask = (1 << bits_needed) - 1
-        
-        byte_index = 0
-        for _ in range(row_count):
-            # Ensure we have enough bits
-            while bits_in_byte < bits_needed and byte_index < len(packed_data):
-                current_byte = (current_byte << 8) | packed_data[byte_index]
-                bits_in_byte += 8
-                byte_index += 1
-            
-            # Extract value
-            if bits_in_byte < bits_needed:
-                # Handle partial byte at end if needed
-                shift = bits_in_byte - bits_needed
-                if shift < 0:
-                    current_byte = current_byte << -shift
-                    shift = 0
-            else:
-                shift = bits_in_byte - bits_needed
-                
-            index = (current_byte >> shift) & mask
-            
-            # Update bit buffer
-            current_byte &= (1 << shift) - 1
-            bits_in_byte = shift
-            
-            # Convert index to value
-            values.append(None if index == null_value else value_dict[index])
-        
-        return np.array(values, dtype='O')
\ No newline at end of file
+        # Unpack indexes and resolve them with one gather. The null index is the
+        # largest code, so clamping it to dict_size lands on the None slot
+        codes = _unpack_codes(np.frombuffer(packed_data, dtype=np.uint8), row_count, bits_needed)
+        return lookup[np.minimum(codes, dict_size)]
@@ -16,19 +16,26 @@ class DataType(Enum):
     @classmethod
     def from_numpy_dtype(cls, dtype: np.dtype) -> 'DataType':
         """Convert numpy dtype to HYBF DataType."""
-        mapping = {
-            np.int32: cls.INT32,
-            np.int64: cls.INT64,
-            np.float32: cls.FLOAT32,
-            np.float64: cls.FLOAT64,
-            np.bool_: cls.BOOLEAN,
-            np.object_: cls.STRING
-        }
-        return mapping.get(dtype.type, cls.STRING)
+        return _FROM_NUMPY_TYPE.get(dtype.type, cls.STRING)
+
+# Keyed by the dtype's scalar type, so any byte order maps to the same member
+_FROM_NUMPY_TYPE = {
+    np.int32: DataType.INT32,
+    np.int64: DataType.INT64,
+    np.float32: DataType.FLOAT32,
+    np.float64: DataType.FLOAT64,
+    np.bool_: DataType.BOOLEAN,
+    np.object_: DataType.STRING
+}
+
+# Storage bit width for a non-negative integer column, by max value bit length
+_BIT_WIDTH_BY_BITS = tuple(8 if bits <= 8 else 16 if bits <= 16 else 32 if bits <= 32 else 64
+                           for bits in range(65))
 
 @dataclass
 class StorageType:
     """Physical storage representation of data."""
+    __slots__ = ('base_type', 'bit_width')
     base_type: DataType
     bit_width: int
 
@@ -45,12 +52,7 @@ class StorageType:
             max_val = np.max(data)
             
             if min_val >= 0:
-                if max_val < 256:
-                    return cls(dtype, 8)
-                elif max_val < 65536:
-                    return cls(dtype, 16)
-                elif max_val < 4294967296:
-                    return cls(dtype, 32)
+                return cls(dtype, _BIT_WIDTH_BY_BITS[int(max_val).bit_length()])
             return cls(dtype, 64)
             
         # Float types maintain their original precision
@@ -59,6 +61,7 @@ class StorageType:
 @dataclass
 class ColumnType:
     """Complete type information for a column."""
+    __slots__ = ('name', 'logical_type', 'storage_type')
     name: str
     logical_type: DataType
     storage_type: StorageType
\ No newline at end of file
@@ -12,19 +12,46 @@ from hybf.core.dtypes import FormatType
 from hybf import MinimalWriter, MinimalReader
 from hybf import CompressedWriter, CompressedReader
 
+# Frames estimated at or below this many bytes are written in the minimal format
+MINIMAL_SIZE_THRESHOLD = 4096
+# Estimates inside this band are close enough to the threshold to measure exactly
+EXACT_SIZE_BAND = (2048, 8192)
+# Object columns are sized from this many leading rows
+OBJECT_SAMPLE_ROWS = 32
+
+def _estimate_data_size(df: pd.DataFrame) -> int:
+    """
+    Estimate df.memory_usage(deep=True).sum() without visiting every object.
+    
+    Shallow usage is known from the dtypes alone; object columns add the
+    per-row size of the objects in their first OBJECT_SAMPLE_ROWS rows.
+    """
+    size = df.memory_usage(deep=False).sum()
+    sample = df.iloc[:OBJECT_SAMPLE_ROWS]
+    for i, dtype in enumerate(df.dtypes):
+        if dtype == object and len(sample):
+            col = sample.iloc[:, i]
+            extra = col.memory_usage(deep=True, index=False) - col.memory_usage(index=False)
+            size += extra * len(df) // len(sample)
+    return int(size)
+
 # Factory for creating appropriate reader/writer based on data characteristics
 class FormatFactory:
     @staticmethod
     def create_writer(df: pd.DataFrame) -> BaseWriter:
         """Create appropriate writer based on DataFrame characteristics."""
+        data_size = _estimate_data_size(df)
+        if EXACT_SIZE_BAND[0] <= data_size <= EXACT_SIZE_BAND[1]:
+            data_size = df.memory_usage(deep=True).sum()
+        
         estimated_size = (
-            df.memory_usage(deep=True).sum() +  # Data size
+            data_size +  # Data size
             sum(len(name.encode('utf-8')) for name in df.columns) +  # Column names
             8 +  # Header
             2 * len(df.columns)  # Column definitions
         )
         
-        return MinimalWriter() if estimated_size <= 4096 else CompressedWriter()
+        return MinimalWriter() if estimated_size <= MINIMAL_SIZE_THRESHOLD else CompressedWriter()
     
     @staticmethod
     def create_reader(file: BinaryIO) -> BaseReader:
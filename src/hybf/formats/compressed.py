@@ -5,107 +5,292 @@ import struct
 import pandas as pd
 import numpy as np
 import io
-from typing import Tuple, List, Dict, Any, BinaryIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Any, BinaryIO, Optional
 
 from hybf import BaseWriter
 from hybf import BaseReader, BinaryReader
 from hybf.core.encoding import BitPackedDictionaryWriter, BitPackedDictionaryReader 
 from hybf import DataType
 from hybf import ColumnInfo
-from hybf.core.dtypes import CompressionType, FormatType
-from hybf.utils.numeric import analyze_numeric_column, read_numeric_column, write_numeric_column
+from hybf.core.dtypes import CompressionType, FormatType, COMPRESSION_TYPE_BY_VALUE
 from hybf.formats.raw import RawWriter, RawReader
+from hybf.utils.jit import NUMBA_AVAILABLE, njit
+
+# Compression type and compressed size ahead of every column
+_COLUMN_HEADER = struct.Struct('>BI')
+# Big-endian run counts/lengths, and the tagged values RLE runs are written as
+_UINT32 = struct.Struct('>I')
+_TAGGED_INT = struct.Struct('>Bq')
+_TAGGED_FLOAT = struct.Struct('>Bd')
+_TAGGED_STR_LEN = struct.Struct('>BB')
+_INT64 = struct.Struct('>q')
+_FLOAT64 = struct.Struct('>d')
+# Step and offset of a quantized column, ahead of its int8 codes
+_QUANT_PARAMS = struct.Struct('>dd')
+# Quantized values take codes -127..127 (254 steps over the column's range);
+# -128 marks a null
+_QUANT_STEPS = 254
+_QUANT_NULL = -128
+
+def _unpack_tagged_value(data: bytes, offset: int) -> Tuple[Any, int]:
+    """Decode the tagged value at offset, returning it and the offset just past it."""
+    value_type = data[offset]
+    offset += 1
+    if value_type == 0:  # null
+        return None, offset
+    elif value_type == 1:  # integer
+        return _INT64.unpack_from(data, offset)[0], offset + _INT64.size
+    elif value_type == 2:  # float
+        return _FLOAT64.unpack_from(data, offset)[0], offset + _FLOAT64.size
+    elif value_type == 3:  # string
+        length = data[offset]
+        offset += 1
+        return data[offset:offset + length].decode('utf-8'), offset + length
+    raise ValueError(f"Unknown value type: {value_type}")
+
+@njit(cache=True)
+def _parse_numeric_runs(packed, num_runs):
+    """
+    Parse an RLE run table of null/int/float tagged values from a uint8 array.
+    
+    Returns (tags, bits, counts), where bits holds each value's raw big-endian
+    8 bytes as an int64. Strings have no fixed width, so a string or unknown
+    tag stops the scan and returns empty arrays for the Python path to handle.
+    """
+    tags = np.empty(num_runs, dtype=np.uint8)
+    bits = np.zeros(num_runs, dtype=np.int64)
+    counts = np.empty(num_runs, dtype=np.int64)
+    pos = 4
+    for run in range(num_runs):
+        tag = packed[pos]
+        pos += 1
+        if tag == 1 or tag == 2:
+            value = np.int64(0)
+            for _ in range(8):
+                value = (value << 8) | np.int64(packed[pos])
+                pos += 1
+            bits[run] = value
+        elif tag != 0:
+            return tags[:0], bits[:0], counts[:0]
+        tags[run] = tag
+        count = np.int64(0)
+        for _ in range(4):
+            count = (count << 8) | np.int64(packed[pos])
+            pos += 1
+        counts[run] = count
+    return tags, bits, counts
+
+def _decode_numeric_runs(data: bytes, num_runs: int, dtype: np.dtype):
+    """
+    Decode a numeric column's run values and counts with _parse_numeric_runs.
+    
+    Returns None when the runs can't be represented in dtype without the
+    Python path's object conversion (strings, or nulls in an integer column).
+    """
+    tags, bits, counts = _parse_numeric_runs(np.frombuffer(data, dtype=np.uint8), num_runs)
+    if len(tags) != num_runs:
+        return None
+    if dtype.kind == 'f':
+        values = np.where(tags == 2, bits.view(np.float64), bits.astype(np.float64))
+        values[tags == 0] = np.nan
+    elif (tags == 1).all():
+        values = bits
+    else:
+        return None
+    return values, counts
+
+def _pack_single_value(value: Any, length: int) -> bytes:
+    """Encode a single-value column: the tagged value followed by the row count."""
+    if pd.isna(value):
+        return bytes((0,)) + _UINT32.pack(length)
+    elif isinstance(value, (int, np.integer)):
+        return _TAGGED_INT.pack(1, value) + _UINT32.pack(length)
+    elif isinstance(value, (float, np.floating)):
+        return _TAGGED_FLOAT.pack(2, value) + _UINT32.pack(length)
+    val_bytes = str(value).encode('utf-8')
+    return _TAGGED_STR_LEN.pack(3, len(val_bytes)) + val_bytes + _UINT32.pack(length)
 
 class CompressionSelector:
     """Analyzes columns to determine optimal compression strategy."""
     
-    def __init__(self, uniqueness_threshold: float = 0.1, redundancy_threshold: float = 0.5):
+    def __init__(
+        self,
+        uniqueness_threshold: float = 0.1,
+        redundancy_threshold: float = 0.5,
+        quantize_tolerance: Optional[float] = None
+    ):
         self.uniqueness_threshold = uniqueness_threshold  # For dictionary encoding
         self.redundancy_threshold = redundancy_threshold  # For RLE
+        # Largest absolute error accepted to store a float column as int8
+        # codes; None keeps every column lossless
+        self.quantize_tolerance = quantize_tolerance
         
     def select_strategy(self, series: pd.Series) -> Tuple[CompressionType, Any]:
         """
         Analyze a column and return the best compression strategy and any needed metadata.
         Returns tuple of (compression_type, metadata)
         """
+        # Distinct non-null values, and each row's index into them (-1 for
+        # nulls); factorize finds the nulls too, so there's no separate
+        # pd.isna pass over the column
+        arr = series.to_numpy()
+        codes, uniques = pd.factorize(arr)
+        
         # Check for null column
-        if series.isna().all():
+        if not len(uniques):
             return CompressionType.NULL, None
         
-        if len(series[series.isna()].drop_duplicates()) > 1:
+        isna_mask = codes < 0
+        null_count = int(np.count_nonzero(isna_mask))
+        if null_count > 1 and len(series[isna_mask].drop_duplicates()) > 1:
             Warning("Series has more than one type of null value. These will be converted to None.")
         
         # Check for single value, properly handling NaN
-        non_null_values = series.dropna()
-        if len(non_null_values) > 0 and non_null_values.nunique() == 1 and series.isna().sum() == 0:
+        if len(uniques) == 1 and null_count == 0:
             return CompressionType.SINGLE_VALUE, series.iloc[0]
 
         #What is the type of the non-null values?
         #if non_null_values.infer_objects().dtypes == object:
             
-        # Calculate value frequencies
-        value_counts = series.value_counts()
-        unique_ratio = len(value_counts) / len(series)
+        unique_ratio = len(uniques) / len(series)
         
-        # For string columns, consider dictionary encoding
+        # For string columns, consider dictionary encoding; the factorized codes
+        # are the dictionary indexes, so the writer packs them as they are
         if series.dtype == object and unique_ratio <= self.uniqueness_threshold:
-            return CompressionType.DICTIONARY, dict(enumerate(value_counts.index))
+            return CompressionType.DICTIONARY, (codes, uniques)
             
         # For numeric columns, check for run-length encoding potential
         if np.issubdtype(series.dtype, np.number):
             # Calculate runs
             runs = self._calculate_runs(series)
-            if len(runs) / len(series) <= self.redundancy_threshold:
-                return CompressionType.RLE, None
+            if len(runs[1]) / len(series) <= self.redundancy_threshold:
+                # Hand the runs to the writer so it doesn't scan the column again
+                return CompressionType.RLE, runs
+        
+        # For float columns, quantize when the caller accepts the rounding error
+        if self.quantize_tolerance is not None and series.dtype.kind == 'f':
+            low, high = float(np.nanmin(arr)), float(np.nanmax(arr))
+            step = (high - low) / _QUANT_STEPS
+            if step / 2 <= self.quantize_tolerance:
+                # A constant column with nulls still needs a nonzero step
+                return CompressionType.QUANTIZED, (step or 1.0, low)
                 
         # Default to raw storage
         return CompressionType.RAW, None
     
-    def _calculate_runs(self, series: pd.Series) -> List[Tuple[Any, int]]:
-        """Calculate run-length encoding runs for a series."""
-        runs = []
-        current_value = series.iloc[0]
-        current_count = 1
+    def _calculate_runs(self, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate run-length encoding runs for a series.
         
-        for value in series.iloc[1:]:
-            if value == current_value:
-                current_count += 1
-            else:
-                runs.append((current_value, current_count))
-                current_value = value
-                current_count = 1
-                
-        runs.append((current_value, current_count))
-        return runs
+        Returns (values, counts) arrays with one entry per run. Neighbouring
+        NaNs are treated as equal, so a gap of nulls is a single run.
+        """
+        arr = series.to_numpy()
+        if len(arr) == 0:
+            return arr, np.empty(0, dtype=np.int64)
+        
+        if arr.dtype.kind in 'biuf':
+            changed = arr[1:] != arr[:-1]
+            if arr.dtype.kind == 'f':
+                nan = np.isnan(arr)
+                changed &= ~(nan[1:] & nan[:-1])
+        else:
+            # Object values only promise ==, so compare neighbours in Python
+            changed = np.fromiter(
+                (not (a == b) for a, b in zip(arr[1:], arr[:-1])),
+                dtype=bool, count=len(arr) - 1
+            )
+        
+        starts = np.flatnonzero(np.r_[True, changed])
+        counts = np.diff(np.r_[starts, len(arr)])
+        return arr[starts], counts
+
+
+
+def _has_fileno(file: BinaryIO) -> bool:
+    """True when the file object is backed by an OS file descriptor."""
+    try:
+        file.fileno()
+        return True
+    except (AttributeError, OSError):
+        return False
 
 
+def _can_patch(file: BinaryIO) -> bool:
+    """True when a header written earlier in the file can be seeked back to and rewritten."""
+    try:
+        seekable = file.seekable()
+    except AttributeError:
+        return False
+    # Append mode sends every write to the end regardless of seek position
+    return seekable and 'a' not in getattr(file, 'mode', '')
+
+# Encodings whose size scales with the column; single-value and null columns
+# are a few bytes, so packing them whole is cheaper than two seeks
+_STREAMED_COMPRESSION = (
+    CompressionType.RAW, CompressionType.RLE, CompressionType.DICTIONARY, CompressionType.QUANTIZED
+)
+
 
 class CompressedWriter(BaseWriter):
     """Writer implementation for the compressed format."""
     
-    def __init__(self):
-        self.compression_selector = CompressionSelector()
+    # Column buffers allowed in flight before the compressing thread waits on the writer
+    MAX_PENDING_WRITES = 32
+
+    def __init__(self, background_io: bool = False, quantize_tolerance: Optional[float] = None):
+        # quantize_tolerance opts in to lossy int8 storage of float columns whose
+        # values all round to within it; see CompressionSelector
+        self.compression_selector = CompressionSelector(quantize_tolerance=quantize_tolerance)
+        # Hand compressed columns to a writer thread so the next column is compressed
+        # while the previous one is written. Only used for file objects with a fileno.
+        self.background_io = background_io
     
     def write(self, df: pd.DataFrame, file: BinaryIO) -> None:
         # Write header
         self.write_header(file, FormatType.COMPRESSED, len(df.columns))
         
-        # Write column definitions
+        # Write column definitions; df.dtypes reads every column's dtype from
+        # the blocks in one call rather than building a Series per name
         columns = [
-            ColumnInfo(name, DataType.from_numpy(df[name].dtype))
-            for name in df.columns
+            ColumnInfo(name, DataType.from_numpy(dtype))
+            for name, dtype in df.dtypes.items()
         ]
         self.write_column_definitions(file, columns)
         
         # Write row count
-        file.write(struct.pack('>I', len(df)))
+        file.write(_UINT32.pack(len(df)))
         
-        # Process and write each column
-        for col in columns:
-            series = df[col.name]
+        if self.background_io and _has_fileno(file):
+            self._write_columns_background(file, df)
+            return
+
+        # Process and write each column, taking the Series from one pass of
+        # df.items() instead of a by-name lookup per column
+        for _, series in df.items():
             compression_type, metadata = self.compression_selector.select_strategy(series)
             self._write_compressed_column(file, series, compression_type, metadata)
-    
+
+    def _write_columns_background(
+        self,
+        file: BinaryIO,
+        df: pd.DataFrame
+    ) -> None:
+        """Compress columns on the calling thread while a single worker writes them in order."""
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=1) as io_thread:
+            for _, series in df.items():
+                compression_type, metadata = self.compression_selector.select_strategy(series)
+                compressed_data = self._compress_column(series, compression_type, metadata)
+                header = _COLUMN_HEADER.pack(compression_type.value, len(compressed_data))
+                pending.append(io_thread.submit(file.writelines, (header, compressed_data)))
+                if len(pending) > self.MAX_PENDING_WRITES:
+                    pending.popleft().result()
+            while pending:
+                pending.popleft().result()
+
     def _write_compressed_column(
         self, 
         file: BinaryIO, 
@@ -114,76 +299,137 @@ class CompressedWriter(BaseWriter):
         metadata: Any
     ) -> None:
         """Write a compressed column to the file."""
-        # Write compression type
-        file.write(struct.pack('B', compression_type.value))
-        
+        if compression_type == CompressionType.RAW and series.dtype != object:
+            # Fixed-width raw columns are the array's bytes, so the size is known
+            # up front and the data goes to the file without a staging buffer
+            arr = np.ascontiguousarray(series.to_numpy())
+            file.write(_COLUMN_HEADER.pack(compression_type.value, arr.nbytes))
+            file.write(arr.view(np.uint8))
+            return
+
+        if compression_type in _STREAMED_COMPRESSION and _can_patch(file):
+            # Encode straight into the file behind a placeholder header, then
+            # seek back and fill in the size, so no copy of the column is held
+            header_pos = file.tell()
+            file.write(_COLUMN_HEADER.pack(compression_type.value, 0))
+            start = file.tell()
+            self._encode_column(file, series, compression_type, metadata)
+            end = file.tell()
+            file.seek(header_pos)
+            file.write(_COLUMN_HEADER.pack(compression_type.value, end - start))
+            file.seek(end)
+            return
+
+        # Single-value and null columns are a few bytes; header and data go in one write
+        if compression_type == CompressionType.SINGLE_VALUE:
+            data = _pack_single_value(metadata, len(series))
+            file.write(_COLUMN_HEADER.pack(compression_type.value, len(data)) + data)
+            return
+        if compression_type == CompressionType.NULL:
+            file.write(_COLUMN_HEADER.pack(compression_type.value, _UINT32.size) + _UINT32.pack(len(series)))
+            return
+
+        compressed_data = self._compress_column(series, compression_type, metadata)
+
+        # Write compression type, compressed size and data
+        file.write(_COLUMN_HEADER.pack(compression_type.value, len(compressed_data)))
+        file.write(compressed_data)
+
+    def _compress_column(
+        self,
+        series: pd.Series,
+        compression_type: CompressionType,
+        metadata: Any
+    ) -> bytes:
+        """Encode a column with the given compression type and return the bytes."""
         # Use a temporary buffer to build compressed data
         with io.BytesIO() as buffer:
-            if compression_type == CompressionType.RAW:
-                self._write_raw(buffer, series)
-            elif compression_type == CompressionType.RLE:
-                self._write_rle(buffer, series)
-            elif compression_type == CompressionType.DICTIONARY:
-                self._write_dictionary(buffer, series, metadata)
-            elif compression_type == CompressionType.SINGLE_VALUE:
-                self._write_single_value(buffer, metadata, len(series))
-            elif compression_type == CompressionType.NULL:
-                self._write_null_column(buffer, len(series))
-            
-            # Write compressed size and data
-            compressed_data = buffer.getvalue()
-            file.write(struct.pack('>I', len(compressed_data)))
-            file.write(compressed_data)
+            self._encode_column(buffer, series, compression_type, metadata)
+            return buffer.getvalue()
+
+    def _encode_column(
+        self,
+        buffer: BinaryIO,
+        series: pd.Series,
+        compression_type: CompressionType,
+        metadata: Any
+    ) -> None:
+        """Write a column's encoded data, without the column header, to buffer."""
+        if compression_type == CompressionType.RAW:
+            self._write_raw(buffer, series)
+        elif compression_type == CompressionType.RLE:
+            self._write_rle(buffer, series, metadata)
+        elif compression_type == CompressionType.DICTIONARY:
+            self._write_dictionary(buffer, series, metadata)
+        elif compression_type == CompressionType.SINGLE_VALUE:
+            self._write_single_value(buffer, metadata, len(series))
+        elif compression_type == CompressionType.NULL:
+            self._write_null_column(buffer, len(series))
+        elif compression_type == CompressionType.QUANTIZED:
+            self._write_quantized(buffer, series, *metadata)
    
     def _write_raw(self, buffer: BinaryIO, series: pd.Series) -> None:
         RawWriter.write(buffer, series)
 
-    def _write_rle(self, buffer: BinaryIO, series: pd.Series) -> None:
-        """Write column data using run-length encoding."""
-        runs = self.compression_selector._calculate_runs(series)
-        
-        # Write number of runs
-        buffer.write(struct.pack('>I', len(runs)))
+    def _write_rle(
+        self,
+        buffer: BinaryIO,
+        series: pd.Series,
+        runs: Tuple[np.ndarray, np.ndarray] = None
+    ) -> None:
+        """Write column data using run-length encoding, reusing runs from select_strategy if given."""
+        if runs is None:
+            runs = self.compression_selector._calculate_runs(series)
+        run_values, run_counts = runs
         
-        # Write each run
-        for value, count in runs:
-            if pd.isna(value):
+        # Number of runs, then each run, collected for a single write; nulls
+        # are found with one vectorized pd.isna rather than a call per run
+        out = bytearray(_UINT32.pack(len(run_counts)))
+        run_nulls = pd.isna(run_values).tolist()
+        for value, is_null, count in zip(run_values, run_nulls, run_counts.tolist()):
+            if is_null:
                 # Special handling for null values
-                buffer.write(struct.pack('B', 0))
+                out.append(0)
             elif isinstance(value, (int, np.integer)):
-                buffer.write(struct.pack('>Bq', 1, value))
+                out += _TAGGED_INT.pack(1, value)
             elif isinstance(value, (float, np.floating)):
-                buffer.write(struct.pack('>Bd', 2, value))
+                out += _TAGGED_FLOAT.pack(2, value)
             else:  # String
                 val_bytes = str(value).encode('utf-8')
-                buffer.write(struct.pack('>BB', 3, len(val_bytes)))
-                buffer.write(val_bytes)
-            buffer.write(struct.pack('>I', count))
+                out += _TAGGED_STR_LEN.pack(3, len(val_bytes))
+                out += val_bytes
+            out += _UINT32.pack(count)
+        buffer.write(out)
     
-    def _write_dictionary(self, buffer: BinaryIO, series: pd.Series, value_dict: Dict) -> None:
+    def _write_dictionary(
+        self,
+        buffer: BinaryIO,
+        series: pd.Series,
+        factorized: Tuple[np.ndarray, np.ndarray] = None
+    ) -> None:
+        """Write column data as a dictionary, reusing codes and uniques from select_strategy if given."""
+        if factorized is None:
+            factorized = pd.factorize(series.to_numpy())
         writer = BitPackedDictionaryWriter()
-        writer.write_dictionary(buffer, series, value_dict)
+        writer.write_dictionary(buffer, *factorized)
 
     def _write_single_value(self, buffer: BinaryIO, value: Any, length: int) -> None:
         """Write a column containing a single value repeated."""
-        # Write the value
-        if pd.isna(value):
-            buffer.write(struct.pack('B', 0))
-        elif isinstance(value, (int, np.integer)):
-            buffer.write(struct.pack('>Bq', 1, value))
-        elif isinstance(value, (float, np.floating)):
-            buffer.write(struct.pack('>Bd', 2, value))
-        else:  # String
-            val_bytes = str(value).encode('utf-8')
-            buffer.write(struct.pack('>BB', 3, len(val_bytes)))
-            buffer.write(val_bytes)
-        
-        # Write the length
-        buffer.write(struct.pack('>I', length))
+        buffer.write(_pack_single_value(value, length))
     
     def _write_null_column(self, buffer: BinaryIO, length: int) -> None:
         """Write a column containing only null values."""
-        buffer.write(struct.pack('>I', length))
+        buffer.write(_UINT32.pack(length))
+
+    def _write_quantized(self, buffer: BinaryIO, series: pd.Series, step: float, low: float) -> None:
+        """Write a float column as int8 codes of the steps above its minimum, with nulls as _QUANT_NULL."""
+        values = series.to_numpy()
+        null_mask = np.isnan(values)
+        with np.errstate(invalid='ignore'):
+            codes = np.rint((values - low) / step) - _QUANT_STEPS // 2
+        codes[null_mask] = _QUANT_NULL
+        buffer.write(_QUANT_PARAMS.pack(step, low))
+        buffer.write(codes.astype(np.int8).view(np.uint8))
 
 class CompressedReader(BaseReader):
     """Reader implementation for the compressed format."""
@@ -198,7 +444,7 @@ class CompressedReader(BaseReader):
         columns = self.read_column_definitions(file, num_columns)
         
         # Read row count
-        row_count = struct.unpack('>I', file.read(4))[0]
+        row_count = _UINT32.unpack(file.read(_UINT32.size))[0]
         
         # Read each column
         data = {}
@@ -214,11 +460,9 @@ class CompressedReader(BaseReader):
         row_count: int
     ) -> np.ndarray:
         """Read a compressed column from the file."""
-        # Read compression type
-        compression_type = CompressionType(struct.unpack('B', file.read(1))[0])
-        
-        # Read compressed size
-        compressed_size = struct.unpack('>I', file.read(4))[0]
+        # Read compression type and compressed size
+        compression_value, compressed_size = _COLUMN_HEADER.unpack(file.read(_COLUMN_HEADER.size))
+        compression_type = COMPRESSION_TYPE_BY_VALUE.get(compression_value)
         
         # Read compressed data into buffer
         compressed_data = file.read(compressed_size)
@@ -233,8 +477,10 @@ class CompressedReader(BaseReader):
                 return self._read_single_value(buffer, dtype, row_count)
             elif compression_type == CompressionType.NULL:
                 return self._read_null_column(buffer, row_count)
+            elif compression_type == CompressionType.QUANTIZED:
+                return self._read_quantized(buffer, dtype, row_count)
             else:
-                raise ValueError(f"Unknown compression type: {compression_type}")
+                raise ValueError(f"Unknown compression type: {compression_value}")
 
     def _read_raw(self, buffer: BinaryIO, dtype: DataType, row_count: int) -> np.ndarray:
         """Read raw column data with optimized numeric handling."""
@@ -243,30 +489,31 @@ class CompressedReader(BaseReader):
 
     def _read_rle(self, buffer: BinaryIO, dtype: DataType, row_count: int) -> np.ndarray:
         """Read run-length encoded column data."""
-        # Read number of runs
-        num_runs = struct.unpack('>I', buffer.read(4))[0]
+        # Walk the run table in place rather than reading field by field
+        data = buffer.getvalue()
+        num_runs = _UINT32.unpack_from(data, 0)[0]
+        np_dtype = dtype.to_numpy()
         
-        values = []
-        for _ in range(num_runs):
-            # Read value type and value
-            value_type = struct.unpack('B', buffer.read(1))[0]
-            if value_type == 0:  # null
-                value = None
-            elif value_type == 1:  # integer
-                value = struct.unpack('>q', buffer.read(8))[0]
-            elif value_type == 2:  # float
-                value = struct.unpack('>d', buffer.read(8))[0]
-            elif value_type == 3:  # string
-                length = struct.unpack('B', buffer.read(1))[0]
-                value = buffer.read(length).decode('utf-8')
-            else:
-                raise ValueError(f"Unknown RLE value type: {value_type}")
-            
-            # Read run length
-            count = struct.unpack('>I', buffer.read(4))[0]
-            values.extend([value] * count)
+        # Fixed-width numeric run tables are parsed by the compiled kernel
+        if NUMBA_AVAILABLE and np_dtype.kind in 'iuf':
+            runs = _decode_numeric_runs(data, num_runs, np_dtype)
+            if runs is not None:
+                return np.repeat(*runs).astype(np_dtype, copy=False)
         
-        return np.array(values, dtype=dtype.to_numpy())
+        offset = _UINT32.size
+        # Only the run table is parsed in Python; np.repeat expands it. Numeric
+        # run values go straight into a typed array so the expanded column is
+        # never boxed into Python objects, with null runs stored as NaN
+        is_float = np_dtype.kind == 'f'
+        run_values = np.empty(num_runs, dtype=np_dtype if np_dtype.kind in 'iuf' else object)
+        run_counts = np.empty(num_runs, dtype=np.int64)
+        for run in range(num_runs):
+            value, offset = _unpack_tagged_value(data, offset)
+            run_values[run] = np.nan if value is None and is_float else value
+            run_counts[run] = _UINT32.unpack_from(data, offset)[0]
+            offset += _UINT32.size
+        
+        return np.repeat(run_values, run_counts).astype(np_dtype, copy=False)
     
     def _read_dictionary(self, buffer: BinaryIO, row_count: int) -> np.ndarray:
         reader = BitPackedDictionaryReader()
@@ -274,23 +521,11 @@ class CompressedReader(BaseReader):
     
     def _read_single_value(self, buffer: BinaryIO, dtype: DataType, row_count: int) -> np.ndarray:
         """Read a column containing a single repeated value."""
-        # Read value type and value
-        value_type = struct.unpack('B', buffer.read(1))[0]
-        
-        if value_type == 0:  # null
-            value = None
-        elif value_type == 1:  # integer
-            value = struct.unpack('>q', buffer.read(8))[0]
-        elif value_type == 2:  # float
-            value = struct.unpack('>d', buffer.read(8))[0]
-        elif value_type == 3:  # string
-            length = struct.unpack('B', buffer.read(1))[0]
-            value = buffer.read(length).decode('utf-8')
-        else:
-            raise ValueError(f"Unknown single value type: {value_type}")
+        data = buffer.getvalue()
+        value, offset = _unpack_tagged_value(data, 0)
         
         # Read length (for verification)
-        stored_length = struct.unpack('>I', buffer.read(4))[0]
+        stored_length = _UINT32.unpack_from(data, offset)[0]
         if stored_length != row_count:
             raise ValueError(f"Length mismatch in single-value column: expected {row_count}, got {stored_length}")
         
@@ -299,9 +534,16 @@ class CompressedReader(BaseReader):
     def _read_null_column(self, buffer: BinaryIO, row_count: int) -> np.ndarray:
         """Read a column containing only null values."""
         # Read length (for verification)
-        stored_length = struct.unpack('>I', buffer.read(4))[0]
+        stored_length = _UINT32.unpack(buffer.read(_UINT32.size))[0]
         if stored_length != row_count:
             raise ValueError(f"Length mismatch in null column: expected {row_count}, got {stored_length}")
         
         return np.full(row_count, None, dtype='O')
 
+    def _read_quantized(self, buffer: BinaryIO, dtype: DataType, row_count: int) -> np.ndarray:
+        """Read a quantized float column, restoring each code to its step above the minimum."""
+        step, low = _QUANT_PARAMS.unpack(buffer.read(_QUANT_PARAMS.size))
+        codes = np.frombuffer(buffer.read(row_count), dtype=np.int8)
+        values = (codes.astype(np.float64) + _QUANT_STEPS // 2) * step + low
+        values[codes == _QUANT_NULL] = np.nan
+        return values.astype(dtype.to_numpy(), copy=False)
@@ -1,17 +1,42 @@
 # src/hybf/formats/hybf.py
+import struct
 from typing import BinaryIO, List
 import numpy as np
 import pandas as pd
 from ..core.types import DataType, StorageType, ColumnType
-from ..core.columns import Column, RawColumn
-from ..compression.strategy import CompressionStrategy, DictionaryStrategy
+from ..core.columns import Column, RawColumn, NpyColumn
+from ..compression.strategy import MAX_UNIQUE_RATIO, ColumnStats, CompressionStrategy, DictionaryStrategy
 
 MAGIC = b'HYBF'
-VERSION = 1
+VERSION = 2
+# Version 1 files stored every column in numpy's .npy layout
+NPY_VERSION = 1
 MINIMAL_FORMAT = 1
 COMPRESSED_FORMAT = 2
 SIZE_THRESHOLD = 4096  # 4KB
 
+# Columns are sampled at no fewer than this many random rows before running
+# the compression strategies
+SAMPLE_SIZE = 1024
+
+# magic, version, format type, big-endian column count
+_HEADER = struct.Struct('>4sBBH')
+# logical type, storage base type and bit width after each column name
+_COLUMN_TYPES = struct.Struct('BBB')
+
+def _looks_incompressible(data: np.ndarray) -> bool:
+    """
+    Whether a random sample of the column holds no repeated value. A column
+    with at most MAX_UNIQUE_RATIO * n distinct values is expected to repeat
+    about twenty times in a sample of 2 * sqrt(n) rows, so finding none
+    means dictionary encoding would not pay off.
+    """
+    size = max(SAMPLE_SIZE, 2 * int(np.sqrt(len(data))))
+    if size < len(data):
+        rows = np.random.default_rng(0).choice(len(data), size, replace=False)
+        data = data[np.sort(rows)]
+    return len(pd.unique(data)) == len(data)
+
 class HYBFWriter:
     """Writer for HYBF format."""
     
@@ -21,14 +46,18 @@ class HYBFWriter:
     def write(self, df: pd.DataFrame, buffer: BinaryIO) -> None:
         """Write DataFrame to HYBF format."""
         # Estimate size to choose format
-        estimated_size = sum(col.nbytes for col in df.values.T)
+        # Read from each column's dtype and length; df.values would first
+        # consolidate (and upcast) the whole frame into one array. Extension
+        # dtypes such as categoricals count at object width, which is what
+        # to_numpy hands the column writer
+        estimated_size = len(df) * sum(
+            dtype.itemsize if isinstance(dtype, np.dtype) else np.dtype(object).itemsize
+            for dtype in df.dtypes
+        )
         format_type = MINIMAL_FORMAT if estimated_size < SIZE_THRESHOLD else COMPRESSED_FORMAT
         
         # Write header
-        buffer.write(MAGIC)
-        buffer.write(bytes([VERSION]))
-        buffer.write(bytes([format_type]))
-        buffer.write(len(df.columns).to_bytes(2, 'big'))
+        buffer.write(_HEADER.pack(MAGIC, VERSION, format_type, len(df.columns)))
         
         # Write columns
         for col_name, col_data in df.items():
@@ -40,24 +69,25 @@ class HYBFWriter:
         storage_type = StorageType.analyze(np_data)
         col_type = ColumnType(name, logical_type, storage_type)
         
-        # Write column metadata
-        buffer.write(len(name).to_bytes(1, 'big'))
-        buffer.write(name.encode('utf-8'))
-        buffer.write(bytes([logical_type.value]))
-        buffer.write(bytes([storage_type.base_type.value]))
-        buffer.write(bytes([storage_type.bit_width]))
+        # Write column metadata in one call
+        name_bytes = name.encode('utf-8')
+        buffer.write(
+            bytes((len(name_bytes),)) + name_bytes +
+            _COLUMN_TYPES.pack(logical_type.value, storage_type.base_type.value, storage_type.bit_width)
+        )
         
-        if format_type == COMPRESSED_FORMAT:
-            # Try compression strategies
+        if format_type == COMPRESSED_FORMAT and not _looks_incompressible(np_data):
+            # Summarize the column once and let each strategy predict its
+            # size from that, rather than having every strategy scan the data
+            stats = ColumnStats.from_array(np_data)
             best_strategy = None
             min_size = float('inf')
             
             for strategy in self.compression_strategies:
-                if strategy.can_compress(np_data):
-                    size = strategy.estimate_size(np_data)
-                    if size < min_size:
-                        min_size = size
-                        best_strategy = strategy
+                size = strategy.predicted_size(stats)
+                if size is not None and size < min_size:
+                    min_size = size
+                    best_strategy = strategy
             
             if best_strategy:
                 column = best_strategy.compress(np_data, col_type)
@@ -75,33 +105,34 @@ class HYBFReader:
     def read(self, buffer: BinaryIO) -> pd.DataFrame:
         """Read DataFrame from HYBF format."""
         # Verify header
-        magic = buffer.read(4)
-        if magic != MAGIC:
+        header = buffer.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:4] != MAGIC:
             raise ValueError("Invalid HYBF file")
             
-        version = int.from_bytes(buffer.read(1), 'big')
-        if version != VERSION:
+        magic, version, format_type, col_count = _HEADER.unpack(header)
+        if version not in (NPY_VERSION, VERSION):
             raise ValueError(f"Unsupported version: {version}")
-            
-        format_type = int.from_bytes(buffer.read(1), 'big')
-        col_count = int.from_bytes(buffer.read(2), 'big')
+        column_class = NpyColumn if version == NPY_VERSION else RawColumn
         
         # Read columns
         columns = {}
         for _ in range(col_count):
-            name_len = int.from_bytes(buffer.read(1), 'big')
+            name_len = buffer.read(1)[0]
             name = buffer.read(name_len).decode('utf-8')
             
-            logical_type = DataType(int.from_bytes(buffer.read(1), 'big'))
-            base_type = DataType(int.from_bytes(buffer.read(1), 'big'))
-            bit_width = int.from_bytes(buffer.read(1), 'big')
+            logical_value, base_value, bit_width = _COLUMN_TYPES.unpack(buffer.read(_COLUMN_TYPES.size))
+            logical_type = DataType(logical_value)
+            base_type = DataType(base_value)
             
             storage_type = StorageType(base_type, bit_width)
             col_type = ColumnType(name, logical_type, storage_type)
             
-            # Read column data
-            column = RawColumn(col_type)
-            data = column.read(buffer, None)  # row_count not needed for numpy save/load
-            columns[name] = data
-            
-        return pd.DataFrame(columns)
\ No newline at end of file
+            # Read column data; the element count is stored with each column
+            column = column_class(col_type)
+            data = column.read(buffer, None)
+            # Large columns come back as read-only views of the shared file map
+            # (see BinaryReader); a DataFrame must stay writable, so only those
+            # are copied. Readers that can hand out read-only arrays keep the views
+            columns[name] = data if data.flags.writeable else data.copy()
+        
+        return pd.DataFrame(columns, copy=False)
\ No newline at end of file
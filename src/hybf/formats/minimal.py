@@ -20,6 +20,15 @@ from hybf.core.types import (
 )
 from hybf.core.dtypes import FormatType
 from hybf.constants import MAGIC_NUMBER, VERSION
+from hybf.utils.bitmap import count_null_bits, pack_null_bitmap, unpack_null_bitmap
+from hybf.utils.strings import decode_strings, encode_strings
+
+# Big-endian row count, and total byte count of a string column
+_UINT32 = struct.Struct('>I')
+# logical type and name length ahead of each column name
+_COLUMN_PREFIX = struct.Struct('BB')
+# nullability flag after each column name
+_NULLABLE = struct.Struct('?')
 
 class MinimalWriter(BaseWriter):
     """Writer implementation for the minimal format."""
@@ -45,7 +54,7 @@ class MinimalWriter(BaseWriter):
         self._write_column_definitions(file, columns)
         
         # Write row count
-        file.write(struct.pack('>I', len(df)))
+        file.write(_UINT32.pack(len(df)))
         
         # Write data in column-major format
         for col_info, name in zip(columns, df.columns):
@@ -58,14 +67,13 @@ class MinimalWriter(BaseWriter):
     def _write_column_definitions(self, file: BinaryIO, columns: List[ColumnTypeInfo]) -> None:
         """Write column metadata."""
         for col in columns:
-            # Write logical type
-            file.write(struct.pack('B', col.logical_type.value))
-            # Write column name
+            # Logical type, length-prefixed name and nullability in one write
             name_bytes = col.name.encode('utf-8')
-            file.write(struct.pack('B', len(name_bytes)))
-            file.write(name_bytes)
-            # Write nullability
-            file.write(struct.pack('?', col.nullable))
+            file.write(
+                _COLUMN_PREFIX.pack(col.logical_type.value, len(name_bytes))
+                + name_bytes
+                + _NULLABLE.pack(col.nullable)
+            )
     
     def _write_column(self, file: BinaryIO, series: pd.Series, col_info: ColumnTypeInfo) -> None:
         """Write a single column of data."""
@@ -78,13 +86,15 @@ class MinimalWriter(BaseWriter):
     
     def _write_string_column(self, file: BinaryIO, data: np.ndarray, nullable: bool) -> None:
         """Write string column data."""
-        for val in data:
-            if pd.isna(val):
-                file.write(struct.pack('B', 0))  # Zero length indicates null
-            else:
-                val_bytes = str(val).encode('utf-8')
-                file.write(struct.pack('B', len(val_bytes)))
-                file.write(val_bytes)
+        # Total byte count, one length per row (zero indicates null), then
+        # the values concatenated, so each region is read back in one go
+        data = np.where(pd.isna(data), '', data)
+        lengths, blob = encode_strings(data)
+        if lengths and max(lengths) > 0xFF:
+            raise ValueError(f"String of {max(lengths)} bytes exceeds the 255 byte limit")
+        file.write(_UINT32.pack(len(blob)))
+        file.write(bytes(lengths))
+        file.write(blob)
     
     def _write_numeric_column(self, file: BinaryIO, data: np.ndarray, col_info: ColumnTypeInfo) -> None:
         """Write numeric column data."""
@@ -94,18 +104,15 @@ class MinimalWriter(BaseWriter):
         if col_info.nullable:
             # Write null bitmap
             null_mask = pd.isna(data)
-            bitmap = bytearray((len(data) + 7) // 8)
-            for i, is_null in enumerate(null_mask):
-                if is_null:
-                    bitmap[i // 8] |= (1 << (i % 8))
-            file.write(bitmap)
+            file.write(pack_null_bitmap(null_mask))
             
-            # Write non-null values
+            # Write non-null values; boolean indexing already made a
+            # contiguous copy, so write it without another one
             non_null_data = storage_data[~null_mask]
-            file.write(non_null_data.tobytes())
+            file.write(non_null_data.view(np.uint8))
         else:
             # Write all values directly
-            file.write(storage_data.tobytes())
+            file.write(np.ascontiguousarray(storage_data).view(np.uint8))
 
 class MinimalReader(BaseReader):
     """Reader implementation for the minimal format."""
@@ -129,7 +136,7 @@ class MinimalReader(BaseReader):
         columns = self._read_column_definitions(file, num_columns)
         
         # Read row count
-        row_count = struct.unpack('>I', file.read(4))[0]
+        row_count = _UINT32.unpack(file.read(_UINT32.size))[0]
         
         # Read data
         data = {}
@@ -146,13 +153,12 @@ class MinimalReader(BaseReader):
         """Read column metadata."""
         columns = []
         for _ in range(num_columns):
-            # Read logical type
-            logical_type = LogicalType(struct.unpack('B', file.read(1))[0])
-            # Read column name
-            name_length = struct.unpack('B', file.read(1))[0]
+            # Read logical type and column name
+            type_value, name_length = _COLUMN_PREFIX.unpack(file.read(_COLUMN_PREFIX.size))
+            logical_type = LogicalType(type_value)
             name = file.read(name_length).decode('utf-8')
             # Read nullability
-            nullable = struct.unpack('?', file.read(1))[0]
+            nullable = _NULLABLE.unpack(file.read(_NULLABLE.size))[0]
             
             # Create column info (storage type will be determined during reading)
             columns.append(ColumnTypeInfo(name, logical_type, StorageType.STRING, nullable))
@@ -167,14 +173,14 @@ class MinimalReader(BaseReader):
     
     def _read_string_column(self, file: BinaryIO, row_count: int) -> np.ndarray:
         """Read string column data."""
-        values = []
-        for _ in range(row_count):
-            length = struct.unpack('B', file.read(1))[0]
-            if length == 0:
-                values.append(None)
-            else:
-                values.append(file.read(length).decode('utf-8'))
-        return np.array(values, dtype='O')
+        total = _UINT32.unpack(file.read(_UINT32.size))[0]
+        lengths = np.frombuffer(file.read(row_count), dtype=np.uint8)
+        blob = file.read(total)
+        
+        values = np.empty(row_count, dtype='O')
+        values[:] = decode_strings(blob, lengths)
+        values[lengths == 0] = None
+        return values
     
     def _read_numeric_column(self, file: BinaryIO, col_info: ColumnTypeInfo, row_count: int) -> np.ndarray:
         """Read numeric column data."""
@@ -185,26 +191,22 @@ class MinimalReader(BaseReader):
             bitmap_size = (row_count + 7) // 8
             null_bitmap = file.read(bitmap_size)
             
-            # Count non-null values
-            non_null_count = row_count
-            for i in range(row_count):
-                if null_bitmap[i // 8] & (1 << (i % 8)):
-                    non_null_count -= 1
+            null_mask = unpack_null_bitmap(null_bitmap, row_count)
+            non_null_count = row_count - count_null_bits(null_bitmap)
             
             # Read non-null values
             dtype = col_info.logical_type.to_numpy()
             data = reader.read_array(dtype, non_null_count)
             
-            # Create result array
-            result = np.empty(row_count, dtype=dtype)
-            curr_idx = 0
-            
-            for i in range(row_count):
-                if null_bitmap[i // 8] & (1 << (i % 8)):
-                    result[i] = np.nan if dtype.kind == 'f' else None
-                else:
-                    result[i] = data[curr_idx]
-                    curr_idx += 1
+            # Scatter them around the nulls; integer arrays can't hold a null, so
+            # nullable integer columns come back as objects with None
+            if dtype.kind == 'f':
+                result = np.empty(row_count, dtype=dtype)
+                result[null_mask] = np.nan
+            else:
+                result = np.empty(row_count, dtype=object)
+                result[null_mask] = None
+            result[~null_mask] = data
             
             return result
         else:
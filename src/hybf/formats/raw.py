@@ -7,10 +7,21 @@ read_optimized_numeric has it's own internal dtype. Need to fix.
 import struct
 import numpy as np
 import pandas as pd
+from pandas.api.types import infer_dtype
 from typing import Tuple, Optional, BinaryIO
 
 from hybf.core.base import BinaryReader
 from hybf.core.dtypes import DataType
+from hybf.utils.bitmap import count_null_bits, pack_null_bitmap, unpack_null_bitmap
+from hybf.utils.numeric import UNSIGNED_FIRST, fits_float16, fits_float32, smallest_integer_dtype
+from hybf.utils.strings import decode_strings, encode_strings
+
+# Big-endian length prefix ahead of each string value, and dictionary size
+_UINT16 = struct.Struct('>H')
+# Big-endian total byte count of a blocked string column
+_UINT32 = struct.Struct('>I')
+# Dictionary code marking a null row; dictionaries hold fewer values than this
+_DICT_NULL_CODE = 0xFFFF
 
 def analyze_numeric_column(series: pd.Series) -> Tuple[Optional[np.dtype], bool]:
     """
@@ -23,54 +34,56 @@ def analyze_numeric_column(series: pd.Series) -> Tuple[Optional[np.dtype], bool]
         Tuple of (optimal_dtype, contains_null)
         If the series cannot be stored as numeric, returns (None, contains_null)
     """
+    optimal_dtype, contains_null, _ = _analyze_object_values(series)
+    return optimal_dtype, contains_null
+
+def _analyze_object_values(series: pd.Series) -> Tuple[Optional[np.dtype], bool, Optional[np.ndarray]]:
+    """
+    analyze_numeric_column for object series, also returning the numeric array
+    of non-null values the analysis converted, so a writer can cast it straight
+    to the chosen dtype instead of converting the column a second time.
+    
+    Returns:
+        Tuple of (optimal_dtype, contains_null, non_null_values), with
+        (None, contains_null, None) when the series isn't numeric
+    """
     # Drop NA values for analysis
     non_null = series.dropna()
     contains_null = len(non_null) < len(series)
     
     if len(non_null) == 0:
-        return None, True
+        return None, True, None
         
     # Try to convert to numeric, catching errors
     try:
-        # First check if all values are integers
-        if all(isinstance(x, (int, np.integer)) for x in non_null):
-            values = non_null.astype(np.int64)
-            min_val, max_val = values.min(), values.max()
-            
-            # Find the smallest integer type that can hold the values
-            if min_val >= 0:  # Unsigned types
-                if max_val <= np.iinfo(np.uint8).max:
-                    return np.dtype('uint8'), contains_null
-                elif max_val <= np.iinfo(np.uint16).max:
-                    return np.dtype('uint16'), contains_null
-                elif max_val <= np.iinfo(np.uint32).max:
-                    return np.dtype('uint32'), contains_null
-            
-            # Signed types
-            if min_val >= np.iinfo(np.int8).min and max_val <= np.iinfo(np.int8).max:
-                return np.dtype('int8'), contains_null
-            elif min_val >= np.iinfo(np.int16).min and max_val <= np.iinfo(np.int16).max:
-                return np.dtype('int16'), contains_null
-            elif min_val >= np.iinfo(np.int32).min and max_val <= np.iinfo(np.int32).max:
-                return np.dtype('int32'), contains_null
-            return np.dtype('int64'), contains_null
+        # First check if all values are integers; infer_dtype classifies the
+        # objects in one C pass (bools are ints here, as isinstance would say)
+        if infer_dtype(non_null, skipna=False) in ('integer', 'boolean'):
+            values = non_null.to_numpy().astype(np.int64)
+            return smallest_integer_dtype(values.min(), values.max(), UNSIGNED_FIRST), contains_null, values
             
         # Check for float values
-        values = pd.to_numeric(non_null)
+        values = pd.to_numeric(non_null).to_numpy()
         if values.dtype == np.float64:
-            # Check if float32 precision is sufficient
-            float32_values = values.astype(np.float32)
-            if np.allclose(values, float32_values, rtol=1e-6):
-                return np.dtype('float32'), contains_null
-            return np.dtype('float64'), contains_null
+            # The narrowest float type that holds every value exactly
+            if fits_float16(values):
+                return np.dtype('float16'), contains_null, values
+            if fits_float32(values):
+                return np.dtype('float32'), contains_null, values
+            return np.dtype('float64'), contains_null, values
             
     except (ValueError, TypeError):
         # If conversion fails, the series contains non-numeric data
         pass
         
-    return None, contains_null
+    return None, contains_null, None
 
-def write_optimized_numeric(buffer: BinaryIO, series: pd.Series, optimal_dtype: np.dtype) -> None:
+def write_optimized_numeric(
+    buffer: BinaryIO,
+    series: pd.Series,
+    optimal_dtype: np.dtype,
+    non_null_values: Optional[np.ndarray] = None
+) -> None:
     """
     Write numeric data with optimal dtype and null handling.
     
@@ -78,62 +91,113 @@ def write_optimized_numeric(buffer: BinaryIO, series: pd.Series, optimal_dtype:
         buffer: Binary buffer to write to
         series: Series to write
         optimal_dtype: The optimal dtype determined by analyze_numeric_column
+        non_null_values: The series' non-null values as a numeric array, if
+            already converted during analysis
     """
     # Write the dtype code
     dtype_map = {
         'uint8': 1, 'uint16': 2, 'uint32': 3,
         'int8': 4, 'int16': 5, 'int32': 6, 'int64': 7,
-        'float32': 8, 'float64': 9
+        'float32': 8, 'float64': 9, 'float16': 10
     }
     buffer.write(struct.pack('B', dtype_map[optimal_dtype.name]))
     
-    # Write null bitmap if needed
-    null_mask = series.isna()
-    if null_mask.any():
-        bitmap = bytearray((len(series) + 7) // 8)
-        for i, is_null in enumerate(null_mask):
-            if is_null:
-                bitmap[i // 8] |= (1 << (i % 8))
-        buffer.write(bitmap)
-    
-    # Write non-null values with optimal dtype
-    non_null_values = series.dropna().astype(optimal_dtype)
-    buffer.write(non_null_values.tobytes())
+    # Write null bitmap; read_optimized_numeric always expects one.
+    # hasnans is cached on the series, so a column without nulls gets an
+    # all-zero bitmap without building a mask
+    if series.hasnans:
+        null_mask = series.isna().to_numpy()
+        buffer.write(pack_null_bitmap(null_mask))
+        if non_null_values is None:
+            non_null_values = series.to_numpy()[~null_mask]
+    else:
+        buffer.write(bytes((len(series) + 7) // 8))
+        if non_null_values is None:
+            non_null_values = series.to_numpy()
+    
+    # Write non-null values with optimal dtype, straight from the cast array
+    # rather than through a bytes copy of it
+    values = np.ascontiguousarray(non_null_values.astype(optimal_dtype, copy=False))
+    buffer.write(values.view(np.uint8))
+
+def write_dictionary_strings(buffer: BinaryIO, codes: np.ndarray, uniques: np.ndarray) -> None:
+    """
+    Write a string column as a dictionary and one code per row.
+    
+    Args:
+        buffer: Binary buffer to write to
+        codes: Index into uniques for each row, -1 for nulls (as from pd.factorize)
+        uniques: Dictionary values, fewer than _DICT_NULL_CODE of them
+    """
+    # Dictionary size, then its values length-prefixed like plain strings
+    out = bytearray(_UINT16.pack(len(uniques)))
+    for val in uniques:
+        val_bytes = str(val).encode('utf-8')
+        out += _UINT16.pack(len(val_bytes))
+        out += val_bytes
+    buffer.write(out)
+    
+    # Big-endian uint16 codes, with nulls as _DICT_NULL_CODE: the cast wraps
+    # the -1 null codes to 0xFFFF, so it is the only copy made
+    buffer.write(codes.astype('>u2').view(np.uint8))
+
+def write_blocked_strings(buffer: BinaryIO, series: pd.Series) -> None:
+    """
+    Write a string column as its null bitmap, the total byte count, the
+    length of each non-null value and then all values concatenated, so a
+    reader can fetch each region with a single read.
+    
+    Args:
+        buffer: Binary buffer to write to
+        series: String series to write
+    """
+    values = series.to_numpy()
+    null_mask = pd.isna(values)
+    lengths, blob = encode_strings(values[~null_mask])
+    if lengths and max(lengths) > 0xFFFF:
+        raise ValueError(f"String of {max(lengths)} bytes exceeds the 65535 byte limit")
+    
+    buffer.write(pack_null_bitmap(null_mask))
+    buffer.write(_UINT32.pack(len(blob)))
+    buffer.write(np.array(lengths, dtype='>u2').tobytes())
+    buffer.write(blob)
 
 class RawWriter:
     """Handles optimized writing of raw column data."""
     
     @staticmethod
     def write(buffer: BinaryIO, series: pd.Series) -> None:
-        """Write column data with numeric optimization when possible."""
+        """
+        Write column data with numeric optimization when possible.
+        
+        Non-object columns are written as the array's native bytes in one call,
+        so their size is always series.to_numpy().nbytes; CompressedWriter
+        relies on this to write them without buffering.
+        """
         if series.dtype != object:
             # For non-object types, write directly
             buffer.write(series.to_numpy().tobytes('C'))
             return
             
-        # Try to optimize numeric storage
-        optimal_dtype, contains_null = analyze_numeric_column(series)
+        # Try to optimize numeric storage, keeping the converted values
+        optimal_dtype, contains_null, values = _analyze_object_values(series)
         
         if optimal_dtype is not None:
             # Write format marker (1 for optimized numeric)
             buffer.write(struct.pack('B', 1))
-            write_optimized_numeric(buffer, series, optimal_dtype)
+            write_optimized_numeric(buffer, series, optimal_dtype, values)
+            return
+        
+        # Low-cardinality strings are stored once each, with a code per row
+        codes, uniques = pd.factorize(series.to_numpy())
+        if len(uniques) < min(len(series) / 2, _DICT_NULL_CODE):
+            # Write format marker (2 for dictionary)
+            buffer.write(struct.pack('B', 2))
+            write_dictionary_strings(buffer, codes, uniques)
         else:
-            # Write format marker (0 for string)
-            buffer.write(struct.pack('B', 0))
-            # Write null bitmap
-            null_bitmap = bytearray((len(series) + 7) // 8)
-            for i, val in enumerate(series):
-                if pd.isna(val):
-                    null_bitmap[i // 8] |= (1 << (i % 8))
-            buffer.write(null_bitmap)
-            
-            # Write non-null values
-            for val in series:
-                if not pd.isna(val):
-                    val_bytes = str(val).encode('utf-8')
-                    buffer.write(struct.pack('>H', len(val_bytes)))
-                    buffer.write(val_bytes)
+            # Write format marker (3 for blocked strings)
+            buffer.write(struct.pack('B', 3))
+            write_blocked_strings(buffer, series)
 
 class RawReader:
     """Handles optimized reading of raw column data."""
@@ -150,14 +214,17 @@ class RawReader:
         
         if format_type == 1:  # Optimized numeric
             return read_optimized_numeric(buffer, row_count)
-        else:  # String data
+        elif format_type == 2:  # Dictionary-encoded strings
+            return read_dictionary_strings(buffer, row_count)
+        elif format_type == 3:  # Blocked strings
+            return read_blocked_strings(buffer, row_count)
+        else:  # Length-prefixed strings, as written by earlier versions
             # Read null bitmap
             bitmap_size = (row_count + 7) // 8
             null_bitmap = buffer.read(bitmap_size)
             
             values = []
-            for i in range(row_count):
-                is_null = bool(null_bitmap[i // 8] & (1 << (i % 8)))
+            for is_null in unpack_null_bitmap(null_bitmap, row_count).tolist():
                 if is_null:
                     values.append(None)
                 else:
@@ -167,6 +234,50 @@ class RawReader:
             
             return np.array(values, dtype='O')
 
+def read_blocked_strings(buffer: BinaryIO, row_count: int) -> np.ndarray:
+    """
+    Read a string column written by write_blocked_strings.
+    
+    Args:
+        buffer: Binary buffer to read from
+        row_count: Number of rows to read
+        
+    Returns:
+        object array with None for nulls
+    """
+    null_bitmap = buffer.read((row_count + 7) // 8)
+    null_mask = unpack_null_bitmap(null_bitmap, row_count)
+    non_null_count = row_count - count_null_bits(null_bitmap)
+    total = _UINT32.unpack(buffer.read(_UINT32.size))[0]
+    lengths = np.frombuffer(buffer.read(non_null_count * 2), dtype='>u2')
+    blob = buffer.read(total)
+    
+    result = np.empty(row_count, dtype='O')
+    result[~null_mask] = decode_strings(blob, lengths)
+    return result
+
+def read_dictionary_strings(buffer: BinaryIO, row_count: int) -> np.ndarray:
+    """
+    Read a string column written by write_dictionary_strings.
+    
+    Args:
+        buffer: Binary buffer to read from
+        row_count: Number of rows to read
+        
+    Returns:
+        object array with None for nulls
+    """
+    dict_size = _UINT16.unpack(buffer.read(_UINT16.size))[0]
+    
+    # The extra final slot stays None and stands in for the null code
+    lookup = np.empty(dict_size + 1, dtype='O')
+    for i in range(dict_size):
+        length = _UINT16.unpack(buffer.read(_UINT16.size))[0]
+        lookup[i] = buffer.read(length).decode('utf-8')
+    
+    codes = np.frombuffer(buffer.read(row_count * 2), dtype='>u2')
+    return lookup[np.minimum(codes, dict_size)]
+
 def read_optimized_numeric(buffer: BinaryIO, row_count: int) -> np.ndarray:
     """
     Read numeric data with optimal dtype and null handling.
@@ -182,35 +293,37 @@ def read_optimized_numeric(buffer: BinaryIO, row_count: int) -> np.ndarray:
     dtype_map = {
         1: np.dtype('uint8'), 2: np.dtype('uint16'), 3: np.dtype('uint32'),
         4: np.dtype('int8'), 5: np.dtype('int16'), 6: np.dtype('int32'),
-        7: np.dtype('int64'), 8: np.dtype('float32'), 9: np.dtype('float64')
+        7: np.dtype('int64'), 8: np.dtype('float32'), 9: np.dtype('float64'),
+        10: np.dtype('float16')
     }
     dtype_code = struct.unpack('B', buffer.read(1))[0]
     dtype = dtype_map[dtype_code]
     
-    # Create array for result
-    result = np.empty(row_count, dtype=dtype)
-    
     # Read null bitmap if present
     if dtype_code > 0:
         bitmap_size = (row_count + 7) // 8
         null_bitmap = buffer.read(bitmap_size)
         
-        # Read non-null values
-        non_null_count = row_count - sum(
-            bin(byte).count('1') for byte in null_bitmap[:bitmap_size-1]
-        ) - bin(null_bitmap[-1]).count('1')
+        null_mask = unpack_null_bitmap(null_bitmap, row_count)
+        null_count = count_null_bits(null_bitmap)
+        non_null_count = row_count - null_count
         
         # Read the actual data
         data = np.frombuffer(buffer.read(non_null_count * dtype.itemsize), dtype=dtype)
         
-        # Fill result array
-        curr_idx = 0
-        for i in range(row_count):
-            is_null = bool(null_bitmap[i // 8] & (1 << (i % 8)))
-            if is_null:
-                result[i] = np.nan if dtype.kind == 'f' else None
-            else:
-                result[i] = data[curr_idx]
-                curr_idx += 1
-    
-    return result
\ No newline at end of file
+        # Scatter it around the nulls; integer arrays can't hold a null, so
+        # integer columns with nulls come back as objects with None
+        if dtype.kind == 'f':
+            # pandas has little float16 support, so half floats widen to float32
+            result = np.empty(row_count, dtype=np.float32 if dtype == np.float16 else dtype)
+            result[null_mask] = np.nan
+        elif null_count:
+            result = np.empty(row_count, dtype=object)
+            result[null_mask] = None
+        else:
+            result = np.empty(row_count, dtype=dtype)
+        result[~null_mask] = data
+    else:
+        result = np.empty(row_count, dtype=dtype)
+    
+    return result
@@ -0,0 +1,26 @@
+"""/hybf/src/hybf/utils/bitmap.py
+Null bitmaps shared by the raw and minimal formats. Row i is null when bit
+i % 8 (least significant first) of byte i // 8 is set. np.packbits and
+np.unpackbits handle this order directly, so no compiled kernel is needed.
+"""
+import numpy as np
+
+# np.bitwise_count (a hardware popcount) arrived in NumPy 2.0
+_HAS_BITWISE_COUNT = hasattr(np, 'bitwise_count')
+
+def pack_null_bitmap(null_mask: np.ndarray) -> bytes:
+    """Pack a boolean null mask into a bitmap of (len(null_mask) + 7) // 8 bytes."""
+    return np.packbits(null_mask, bitorder='little').tobytes()
+
+def unpack_null_bitmap(bitmap: bytes, row_count: int) -> np.ndarray:
+    """Unpack a bitmap into a boolean null mask of row_count rows."""
+    return np.unpackbits(
+        np.frombuffer(bitmap, dtype=np.uint8), count=row_count, bitorder='little'
+    ).view(np.bool_)
+
+def count_null_bits(bitmap: bytes) -> int:
+    """Count the null rows in a bitmap; relies on the padding bits being clear."""
+    packed = np.frombuffer(bitmap, dtype=np.uint8)
+    if _HAS_BITWISE_COUNT:
+        return int(np.bitwise_count(packed).sum())
+    return int(np.unpackbits(packed).sum())
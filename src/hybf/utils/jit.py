@@ -0,0 +1,20 @@
+"""/hybf/src/hybf/utils/jit.py
+Optional numba support. numba is not a hard dependency, so kernels are
+decorated with the njit exported here and callers check NUMBA_AVAILABLE
+to choose between the compiled kernel and a pure numpy fallback.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+__all__ = ['NUMBA_AVAILABLE', 'njit', 'prange']
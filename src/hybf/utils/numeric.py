@@ -7,6 +7,73 @@ from typing import Tuple, Optional, BinaryIO
 
 from hybf.core.base import BinaryReader
 
+# Preference orders for smallest_integer_dtype: analyze_numeric_column tries
+# each width signed first, the raw format tries every unsigned type first
+SIGNED_FIRST = ('int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32')
+UNSIGNED_FIRST = ('uint8', 'uint16', 'uint32', 'int8', 'int16', 'int32')
+
+def _width_tables(order: Tuple[str, ...]) -> Tuple[Tuple[np.dtype, ...], Tuple[np.dtype, ...]]:
+    """
+    The first dtype in order holding each bit length, for non-negative ranges
+    [0, 2**b - 1] and for signed ranges [-2**(b-1), 2**(b-1) - 1] (b counting
+    the sign bit), falling back to int64.
+    """
+    ranges = [(np.dtype(name), int(np.iinfo(name).min), int(np.iinfo(name).max)) for name in order]
+    
+    def first_fitting(low: int, high: int) -> np.dtype:
+        for dtype, dtype_low, dtype_high in ranges:
+            if dtype_low <= low and high <= dtype_high:
+                return dtype
+        return np.dtype('int64')
+    
+    unsigned = tuple(first_fitting(0, (1 << bits) - 1) for bits in range(65))
+    signed = tuple(first_fitting(-(1 << bits >> 1), (1 << bits >> 1) - 1) for bits in range(65))
+    return unsigned, signed
+
+# The chosen dtype only depends on how many bits the range needs, so it is
+# looked up by bit length in tables built once per order
+_WIDTH_TABLES = {order: _width_tables(order) for order in (SIGNED_FIRST, UNSIGNED_FIRST)}
+
+def smallest_integer_dtype(min_val: int, max_val: int, order: Tuple[str, ...] = SIGNED_FIRST) -> np.dtype:
+    """First integer type in order (SIGNED_FIRST or UNSIGNED_FIRST) holding [min_val, max_val], else int64."""
+    unsigned, signed = _WIDTH_TABLES[order]
+    min_val, max_val = int(min_val), int(max_val)
+    if min_val >= 0:
+        table, bits = unsigned, max_val.bit_length()
+    else:
+        # ~min_val is -min_val - 1, the magnitude the non-sign bits must hold
+        magnitude = max_val if max_val > ~min_val else ~min_val
+        table, bits = signed, magnitude.bit_length() + 1
+    return table[bits] if bits <= 64 else table[64]
+
+# Elements tested at a time by fits_float32
+_FLOAT32_BLOCK = 1 << 16
+
+def fits_float32(values: np.ndarray) -> bool:
+    """
+    Whether float values are all stored exactly by float32, so a cast to it
+    and back returns the same values.
+    
+    The test runs block by block: the cast makes a temporary the size of its
+    input, which stays in cache at this size, and a block that fails ends the
+    scan without casting the rest.
+    """
+    with np.errstate(over='ignore'):
+        for start in range(0, len(values), _FLOAT32_BLOCK):
+            block = values[start:start + _FLOAT32_BLOCK]
+            if not np.array_equal(block, block.astype(np.float32)):
+                return False
+    return True
+
+def fits_float16(values: np.ndarray) -> bool:
+    """Whether float values are all stored exactly by float16, tested like fits_float32."""
+    with np.errstate(over='ignore'):
+        for start in range(0, len(values), _FLOAT32_BLOCK):
+            block = values[start:start + _FLOAT32_BLOCK]
+            if not np.array_equal(block, block.astype(np.float16)):
+                return False
+    return True
+
 def analyze_numeric_column(series: pd.Series) -> Tuple[Optional[np.dtype], bool]:
     """
     Analyze a pandas Series to determine optimal numeric storage type.
@@ -25,43 +92,28 @@ def analyze_numeric_column(series: pd.Series) -> Tuple[Optional[np.dtype], bool]
     non_null = series.dropna()
     if len(non_null) == 0:
         return None, True
+    # dropna already found the nulls; no second isna() scan for the result
+    has_nulls = len(non_null) < len(series)
         
     # Check if all non-null values are numeric
     try:
         numeric_values = pd.to_numeric(non_null)
     except (ValueError, TypeError):
-        return None, series.isna().any()
+        return None, has_nulls
         
     # Determine if values are integers
     is_integer = np.all(np.equal(np.mod(numeric_values, 1), 0))
     
     if is_integer:
-        # Find min/max to determine optimal integer type
-        min_val = numeric_values.min()
-        max_val = numeric_values.max()
-        
-        # Check ranges for different integer types
-        if min_val >= -128 and max_val <= 127:
-            return np.dtype('int8'), series.isna().any()
-        elif min_val >= 0 and max_val <= 255:
-            return np.dtype('uint8'), series.isna().any()
-        elif min_val >= -32768 and max_val <= 32767:
-            return np.dtype('int16'), series.isna().any()
-        elif min_val >= 0 and max_val <= 65535:
-            return np.dtype('uint16'), series.isna().any()
-        elif min_val >= -2147483648 and max_val <= 2147483647:
-            return np.dtype('int32'), series.isna().any()
-        elif min_val >= 0 and max_val <= 4294967295:
-            return np.dtype('uint32'), series.isna().any()
-        else:
-            return np.dtype('int64'), series.isna().any()
+        # Smallest integer type for the range
+        return smallest_integer_dtype(numeric_values.min(), numeric_values.max()), has_nulls
     else:
         # For floating point, use float32 if precision allows
         float32_values = numeric_values.astype('float32')
         if np.allclose(numeric_values, float32_values):
-            return np.dtype('float32'), series.isna().any()
+            return np.dtype('float32'), has_nulls
         else:
-            return np.dtype('float64'), series.isna().any()
+            return np.dtype('float64'), has_nulls
 
 def write_numeric_column(buffer: BinaryIO, series: pd.Series, dtype: np.dtype, has_nulls: bool) -> None:
     """
@@ -73,17 +125,16 @@ def write_numeric_column(buffer: BinaryIO, series: pd.Series, dtype: np.dtype, h
         dtype: numpy dtype to use for storage
         has_nulls: Whether the series contains null values
     """
+    values = series.to_numpy()
     if has_nulls:
         # Write a null bitmap first
-        null_bitmap = ~series.isna()
-        buffer.write(null_bitmap.to_numpy().tobytes('C'))
-        
-        # Write non-null values
-        non_null_values = series.dropna().astype(dtype)
-        buffer.write(non_null_values.to_numpy().tobytes('C'))
-    else:
-        # Write all values directly
-        buffer.write(series.astype(dtype).to_numpy().tobytes('C'))
+        not_null = ~series.isna().to_numpy()
+        buffer.write(memoryview(not_null).cast('B'))
+        values = values[not_null]
+    
+    # Convert only when needed, then write straight from the array's memory
+    values = np.ascontiguousarray(values.astype(dtype, copy=False))
+    buffer.write(memoryview(values).cast('B'))
 
 def read_numeric_column(buffer: BinaryIO, dtype: np.dtype, row_count: int, has_nulls: bool) -> np.ndarray:
     """
@@ -0,0 +1,32 @@
+"""/hybf/src/hybf/utils/strings.py
+String blocks shared by the raw and minimal formats: the UTF-8 encoded
+values concatenated into one blob, plus the byte length of each value.
+Python str objects can't be built from compiled numba code, so these stay
+in Python, with each loop left to map() or a single comprehension.
+"""
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+def encode_strings(values: Iterable) -> Tuple[List[int], bytes]:
+    """Encode values with str() and UTF-8, returning their lengths and the joined blob."""
+    strs = list(map(str, values))
+    
+    # Pure ASCII text encodes once; byte and character lengths then agree
+    text = ''.join(strs)
+    if text.isascii():
+        return list(map(len, strs)), text.encode('ascii')
+    encoded = list(map(str.encode, strs))
+    return list(map(len, encoded)), b''.join(encoded)
+
+def decode_strings(blob: bytes, lengths: np.ndarray) -> List[str]:
+    """Split a blob into strings of the given byte lengths."""
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    bounds = offsets.tolist()
+
+    # Pure ASCII blobs decode once; character and byte offsets then agree
+    if blob.isascii():
+        text = blob.decode('ascii')
+        return [text[start:end] for start, end in zip(bounds, bounds[1:])]
+    return [blob[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
@@ -3,10 +3,9 @@ PyTest configuration and shared fixtures.
 """
 
 import pytest
-import tempfile
-import os
-import shutil
-from pathlib import Path
+
+from data.generators import DataGenerator
+from utils import assert_df_equal
 
 @pytest.fixture(scope="session")
 def test_data_dir(tmp_path_factory):
@@ -15,65 +14,49 @@ def test_data_dir(tmp_path_factory):
     return temp_dir
 
 @pytest.fixture
-def temp_file(test_data_dir):
-    """Provide a temporary file path for each test that needs it."""
-    temp_file = test_data_dir / "test.hybf"
-    yield temp_file
-    # Cleanup
-    if temp_file.exists():
-        temp_file.unlink()
+def temp_file(tmp_path):
+    """Provide a temporary file path of its own to each test that needs it."""
+    return tmp_path / "test.hybf"
+
+@pytest.fixture(scope="module")
+def hybf_file(tmp_path_factory):
+    """Provide one file path shared by the tests of a module, each overwriting it."""
+    return tmp_path_factory.mktemp("hybf") / "test.hybf"
+
+# Datasets are built once per session; the public fixtures below hand each
+# test its own copy, so tests may modify them freely
+
+@pytest.fixture(scope="session")
+def _small_df_cache():
+    return DataGenerator.create_minimal_dataset()
+
+@pytest.fixture(scope="session")
+def _large_df_cache():
+    return DataGenerator.create_compressed_dataset()
+
+@pytest.fixture(scope="session")
+def _edge_cases_df_cache():
+    return DataGenerator.create_edge_cases_dataset()
 
 @pytest.fixture
-def sample_small_df(test_data_dir):
+def sample_small_df(_small_df_cache):
     """Provide a small DataFrame for testing minimal format."""
-    from data.generators import DataGenerator
-    return DataGenerator.create_minimal_dataset()
+    return _small_df_cache.copy()
 
 @pytest.fixture
-def sample_large_df(test_data_dir):
+def sample_large_df(_large_df_cache):
     """Provide a large DataFrame for testing compressed format."""
-    from data.generators import DataGenerator
-    return DataGenerator.create_compressed_dataset()
+    return _large_df_cache.copy()
 
 @pytest.fixture
-def edge_cases_df(test_data_dir):
+def edge_cases_df(_edge_cases_df_cache):
     """Provide a DataFrame with edge cases."""
-    from data.generators import DataGenerator
-    return DataGenerator.create_edge_cases_dataset()
+    return _edge_cases_df_cache.copy()
 
 @pytest.fixture
 def assert_frame_equal():
     """Provide a custom DataFrame comparison function."""
-    def _assert_frame_equal(df1, df2):
-        """Assert that two DataFrames are equal, handling NaN and null values."""
-        import pandas as pd
-        import numpy as np
-        
-        # Check column names and order
-        assert list(df1.columns) == list(df2.columns)
-        
-        # Check data types
-        for col in df1.columns:
-            # Allow for some type flexibility (e.g., int32 vs int64)
-            assert (np.issubdtype(df1[col].dtype, np.number) == 
-                   np.issubdtype(df2[col].dtype, np.number))
-        
-        # Check values
-        for col in df1.columns:
-            s1, s2 = df1[col], df2[col]
-            
-            # Handle numeric columns
-            if np.issubdtype(s1.dtype, np.number):
-                pd.testing.assert_series_equal(
-                    s1, s2, check_dtype=False, check_exact=False
-                )
-            else:
-                # Handle string and other columns
-                pd.testing.assert_series_equal(
-                    s1, s2, check_dtype=False
-                )
-    
-    return _assert_frame_equal
+    return assert_df_equal
 
 def pytest_configure(config):
     """Add custom markers."""
@@ -3,12 +3,8 @@ Test suite for the hybrid binary format implementation.
 Includes utilities for generating test data and comprehensive test cases.
 """
 
-import unittest
-import tempfile
-import os
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any
 
 class DataGenerator:
     """Utility class for generating test data."""
@@ -25,44 +21,67 @@ class DataGenerator:
         })
     
     @staticmethod
-    def create_compressed_dataset(rows: int = 1000) -> pd.DataFrame:
+    def create_compressed_dataset(rows: int = 1000, seed: int = 0) -> pd.DataFrame:
         """Create a larger dataset with various compression opportunities."""
+        # A seeded generator keeps the dataset identical from run to run
+        rng = np.random.default_rng(seed)
+        
+        # One null mask and one draw of integers, shared by the mixed columns
+        idx = np.arange(rows)
+        probs = rng.random((2, rows))
+        null_mask = probs[0] < 0.1
+        ints = rng.integers(0, 1000, rows)
+        
+        # Category labels picked by code; indexing an object array shares the
+        # label strings rather than allocating one per row
+        categories = np.array(['cat_a', 'cat_b', 'cat_c', None], dtype=object)
+        
+        # Mixed columns are object arrays allocated once, then nulled by mask
+        sparse = np.full(rows, 'value', dtype=object)
+        sparse[probs[1] < 0.8] = None
+        int_and_null = ints.astype(object)
+        int_and_null[null_mask] = None
+        int_and_multinull = ints.astype(object)
+        int_and_multinull[null_mask] = rng.choice(
+            np.array([None, pd.NA, np.nan], dtype=object), int(null_mask.sum())
+        )
+        float_and_null = rng.standard_normal(rows).astype(object)
+        float_and_null[null_mask] = None
+        
         # Generate base data
         data = {
             # Single value column
-            'constant': ['const_value'] * rows,
+            'constant': np.full(rows, 'const_value', dtype=object),
             
             # High cardinality string column
-            'unique_strings': [f'unique_value_{i}' for i in range(rows)],
+            'unique_strings': np.char.add('unique_value_', idx.astype(str)).astype(object),
             
             # Low cardinality string column (good for dictionary encoding)
-            'categorical': np.random.choice(['cat_a', 'cat_b', 'cat_c'], rows),
+            'categorical': categories[rng.integers(0, 3, rows)],
             
             # Low cardinality string column (good for dictionary encoding), with Nan
-            'categorical_with_nan': np.random.choice(['cat_a', 'cat_b', 'cat_c', np.nan], rows),
+            'categorical_with_nan': categories[rng.integers(0, 4, rows)],
 
             # Numeric column with runs (good for RLE)
             'runs': np.repeat(np.arange(rows // 100), 100),
             
             # Regular numeric columns
-            'random_ints': np.random.randint(0, 1000, rows),
-            'random_floats': np.random.randn(rows),
+            'random_ints': rng.integers(0, 1000, rows),
+            'random_floats': rng.standard_normal(rows),
 
             # Null column
-            'nulls': [None] * rows,
+            'nulls': np.full(rows, None, dtype=object),
             
             # Mixed nulls
-            'sparse': np.where(np.random.random(rows) < 0.8, None, 'value'),
+            'sparse': sparse,
 
             # Mixed int and null
-            'random_int_and_null': np.where(np.random.random(rows) < 0.1, [None]*rows, np.random.randint(0, 1000, rows)),
+            'random_int_and_null': int_and_null,
 
-            'random_int_and_multinull': np.where(np.random.random(rows) < 0.1, 
-                                                 np.random.choice([None, pd.NA, np.nan], rows), 
-                                                 np.random.randint(0, 1000, rows)),
+            'random_int_and_multinull': int_and_multinull,
 
             # Mixed int and null
-            'random_float_and_null': np.where(np.random.random(rows) < 0.1, [None]*rows, np.random.randn(rows))
+            'random_float_and_null': float_and_null
 
         }
         return pd.DataFrame(data)
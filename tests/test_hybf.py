@@ -44,8 +44,50 @@ def test_compression_threshold():
     # Verify compressed format was used
     buffer.seek(0)
     assert buffer.read(4) == b'HYBF'
-    assert buffer.read(1) == bytes([1])  # version
+    assert buffer.read(1) == bytes([2])  # version
     assert buffer.read(1) == bytes([2])  # COMPRESSED_FORMAT
 
+def test_dictionary_for_many_repeated_values(tmp_path):
+    """Test that a long column with thousands of distinct values is still dictionary encoded."""
+    rows = 200_000
+    df = pd.DataFrame({'int_col': np.random.default_rng(0).integers(0, 2000, rows)})
+    path = tmp_path / 'dict.hybf'
+    write_dataframe(df, path)
+    
+    # Two-byte codes instead of eight-byte integers
+    assert path.stat().st_size < rows * 8 / 2
+
+def test_categorical_columns_use_compressed_format(tmp_path):
+    """Test that categoricals are sized by their values, not their codes."""
+    df = pd.DataFrame({'cat_col': pd.Categorical(['x', 'y', 'z'] * 1000)})
+    path = tmp_path / 'cat.hybf'
+    write_dataframe(df, path)
+    
+    assert path.read_bytes()[5] == 2  # COMPRESSED_FORMAT
+    assert len(read_dataframe(path)) == len(df)
+
+def test_skips_strategies_for_distinct_values():
+    """Test that only columns with no repeats in the sample skip compression."""
+    from hybf.formats.hybf import _looks_incompressible
+    rng = np.random.default_rng(0)
+    
+    assert _looks_incompressible(rng.random(2_000_000))
+    assert not _looks_incompressible(rng.integers(0, 100_000, 1_000_000))
+
+def test_reads_version_1_files(tmp_path):
+    """Test that files whose columns were written with np.save still read."""
+    columns = {'int_col': np.arange(5, dtype=np.int64), 'float_col': np.linspace(0, 1, 5)}
+    
+    buffer = io.BytesIO()
+    buffer.write(b'HYBF' + bytes([1, 1]) + len(columns).to_bytes(2, 'big'))
+    for name, data in columns.items():
+        # Name, then logical type, storage base type and bit width
+        buffer.write(bytes([len(name)]) + name.encode('utf-8') + bytes([2 if data.dtype.kind == 'i' else 4] * 2 + [64]))
+        np.save(buffer, data)
+    path = tmp_path / 'v1.hybf'
+    path.write_bytes(buffer.getvalue())
+    
+    pd.testing.assert_frame_equal(read_dataframe(path), pd.DataFrame(columns))
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
@@ -14,6 +14,12 @@ from hybf.core.dtypes import FormatType
 class TestMinimalFormat:
     """Test cases for minimal format implementation."""
     
+    @classmethod
+    def setup_class(cls):
+        """Share one writer and reader across the tests in this class."""
+        cls.writer = MinimalWriter()
+        cls.reader = MinimalReader()
+    
     def test_basic_roundtrip(self):
         """Test basic write and read functionality."""
         # Create test data
@@ -27,13 +33,11 @@ class TestMinimalFormat:
         
         # Write to buffer
         buffer = io.BytesIO()
-        writer = MinimalWriter()
-        writer.write(df, buffer)
+        self.writer.write(df, buffer)
         
         # Read back
         buffer.seek(0)
-        reader = MinimalReader()
-        df_read = reader.read(buffer)
+        df_read = self.reader.read(buffer)
         
         # Compare
         pd.testing.assert_frame_equal(df, df_read, check_dtype=False)
@@ -52,13 +56,11 @@ class TestMinimalFormat:
         
         # Write to buffer
         buffer = io.BytesIO()
-        writer = MinimalWriter()
-        writer.write(df, buffer)
+        self.writer.write(df, buffer)
         
         # Read back
         buffer.seek(0)
-        reader = MinimalReader()
-        df_read = reader.read(buffer)
+        df_read = self.reader.read(buffer)
         
         # Compare
         pd.testing.assert_frame_equal(df, df_read, check_dtype=False)
@@ -86,13 +88,11 @@ class TestMinimalFormat:
         
         # Write to buffer
         buffer = io.BytesIO()
-        writer = MinimalWriter()
-        writer.write(df, buffer)
+        self.writer.write(df, buffer)
         
         # Read back
         buffer.seek(0)
-        reader = MinimalReader()
-        df_read = reader.read(buffer)
+        df_read = self.reader.read(buffer)
         
         # Compare
         pd.testing.assert_frame_equal(df, df_read, check_dtype=False)
@@ -104,13 +104,11 @@ class TestMinimalFormat:
         
         # Write to buffer
         buffer = io.BytesIO()
-        writer = MinimalWriter()
-        writer.write(df, buffer)
+        self.writer.write(df, buffer)
         
         # Read back
         buffer.seek(0)
-        reader = MinimalReader()
-        df_read = reader.read(buffer)
+        df_read = self.reader.read(buffer)
         
         # Compare
         pd.testing.assert_frame_equal(df, df_read, check_dtype=False)
@@ -121,7 +119,7 @@ class TestMinimalFormat:
         buffer = io.BytesIO()
         buffer.write(b'INVALID')
         buffer.seek(0)
-        reader = MinimalReader()
+        reader = self.reader
         with pytest.raises(ValueError, match="Invalid file format"):
             reader.read(buffer)
         
@@ -153,5 +151,4 @@ class TestMinimalFormat:
         
         # Write to buffer
         buffer = io.BytesIO()
-        writer = MinimalWriter()
-        writer.write(df, buffer)
\ No newline at end of file
+        self.writer.write(df, buffer)
\ No newline at end of file
@@ -7,7 +7,7 @@ import pandas as pd
 import pytest
 
 from hybf.formats.raw import RawWriter, RawReader
-from hybf.core.types import LogicalType
+from hybf.core.dtypes import DataType
 
 class TestRawFormat:
     """Test cases for raw format handlers."""
@@ -40,7 +40,7 @@ class TestRawFormat:
             buffer.seek(0)
             result = RawReader.read(
                 buffer,
-                LogicalType.from_numpy(series.dtype),
+                DataType.from_numpy(series.dtype),
                 len(series)
             )
             
@@ -82,7 +82,7 @@ class TestRawFormat:
             buffer.seek(0)
             result = RawReader.read(
                 buffer,
-                LogicalType.STRING,
+                DataType.STRING,
                 len(series)
             )
             
@@ -93,6 +93,12 @@ class TestRawFormat:
                 check_dtype=False
             )
     
+    def test_string_too_long(self):
+        """Test that strings beyond the uint16 length field are rejected."""
+        buffer = io.BytesIO()
+        with pytest.raises(ValueError):
+            RawWriter.write(buffer, pd.Series(['a', 'b' * 70000]))
+    
     def test_mixed_types(self):
         """Test handling of mixed type data."""
         # Mixed numeric types
@@ -100,7 +106,7 @@ class TestRawFormat:
         buffer = io.BytesIO()
         RawWriter.write(buffer, series)
         buffer.seek(0)
-        result = RawReader.read(buffer, LogicalType.FLOAT64, len(series))
+        result = RawReader.read(buffer, DataType.FLOAT64, len(series))
         pd.testing.assert_series_equal(
             pd.Series(result),
             series,
@@ -112,7 +118,7 @@ class TestRawFormat:
         buffer = io.BytesIO()
         RawWriter.write(buffer, series)
         buffer.seek(0)
-        result = RawReader.read(buffer, LogicalType.STRING, len(series))
+        result = RawReader.read(buffer, DataType.STRING, len(series))
         pd.testing.assert_series_equal(
             pd.Series(result).astype(str),
             series.astype(str),
@@ -126,7 +132,7 @@ class TestRawFormat:
         buffer = io.BytesIO()
         RawWriter.write(buffer, series)
         buffer.seek(0)
-        result = RawReader.read(buffer, LogicalType.FLOAT64, 0)
+        result = RawReader.read(buffer, DataType.FLOAT64, 0)
         assert len(result) == 0
         
         # Series with only nulls
@@ -134,7 +140,7 @@ class TestRawFormat:
         buffer = io.BytesIO()
         RawWriter.write(buffer, series)
         buffer.seek(0)
-        result = RawReader.read(buffer, LogicalType.STRING, len(series))
+        result = RawReader.read(buffer, DataType.STRING, len(series))
         pd.testing.assert_series_equal(
             pd.Series(result),
             series,
@@ -146,9 +152,32 @@ class TestRawFormat:
         buffer = io.BytesIO()
         RawWriter.write(buffer, series)
         buffer.seek(0)
-        result = RawReader.read(buffer, LogicalType.INT32, len(series))
+        result = RawReader.read(buffer, DataType.from_numpy(series.dtype), len(series))
         pd.testing.assert_series_equal(
             pd.Series(result),
             series,
             check_dtype=False
-        )
\ No newline at end of file
+        )
+    
+    def test_float16_storage(self):
+        """Test that floats held exactly by float16 are stored at half width."""
+        test_cases = [
+            # (data, expected dtype code)
+            (pd.Series([1.0, 0.5, None, 0.25], dtype=object), 10),  # Exact in float16
+            (pd.Series([0.1, None, 2.0], dtype=object), 9),  # Not exact in float32
+            (pd.Series([70000.5, None], dtype=object), 8),  # Beyond float16 range, exact in float32
+        ]
+        
+        for series, expected_code in test_cases:
+            buffer = io.BytesIO()
+            RawWriter.write(buffer, series)
+            # Format marker, then the dtype code
+            assert buffer.getvalue()[1] == expected_code
+            
+            buffer.seek(0)
+            result = RawReader.read(buffer, DataType.STRING, len(series))
+            pd.testing.assert_series_equal(
+                pd.Series(result),
+                series.astype(float),
+                check_dtype=False
+            )
\ No newline at end of file